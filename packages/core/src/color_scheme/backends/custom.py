@@ -5,7 +5,6 @@ from pathlib import Path
 
 import numpy as np
 from PIL import Image
-from sklearn.cluster import KMeans
 
 from color_scheme.config.config import AppConfig
 from color_scheme.config.enums import ColorAlgorithm
@@ -15,6 +14,59 @@ from color_scheme.core.types import Color, ColorScheme, GeneratorConfig
 
 logger = logging.getLogger(__name__)
 
+# Longest side, in pixels, of the image that is actually clustered
+_SAMPLE_SIZE = 200
+
+# Number of bins in the 5-5-5 bit RGB histogram used for clustering
+_HISTOGRAM_BINS = 1 << 15
+
+
+def _sample_pixels(img: Image.Image) -> np.ndarray:
+    """Downsample an image and return its pixels as an (N, 3) array.
+
+    resize() returns a new image, so no full-resolution copy is made, and a
+    box filter (plain area average) is both the cheapest filter and the
+    right one for clustering.
+    """
+    width, height = img.size
+    scale = max(width, height) / _SAMPLE_SIZE
+    if scale > 1:
+        img = img.resize(
+            (max(1, round(width / scale)), max(1, round(height / scale))),
+            Image.Resampling.BOX,
+        )
+    return np.asarray(img).reshape(-1, 3)
+
+
+def _color_histogram(pixels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Bin pixels into a 5-5-5 bit RGB histogram.
+
+    Clustering the occupied bins, weighted by pixel count, gives the same
+    palette as clustering every pixel at a fraction of the cost: real images
+    occupy a few thousand of the 32768 bins.
+
+    Args:
+        pixels: (N, 3) uint8 array of RGB pixels
+
+    Returns:
+        Tuple of (mean color of each occupied bin as an (M, 3) float array,
+        number of pixels in each bin)
+    """
+    rgb = pixels.astype(np.intp)
+    idx = (rgb[:, 0] >> 3) << 10 | (rgb[:, 1] >> 3) << 5 | rgb[:, 2] >> 3
+
+    counts = np.bincount(idx, minlength=_HISTOGRAM_BINS)
+    occupied = np.flatnonzero(counts)
+    weights = counts[occupied]
+    sums = np.stack(
+        [
+            np.bincount(idx, weights=rgb[:, c], minlength=_HISTOGRAM_BINS)[occupied]
+            for c in range(3)
+        ],
+        axis=1,
+    )
+    return sums / weights[:, None], weights
+
 
 class CustomGenerator(ColorSchemeGenerator):
     """Custom backend for color extraction using PIL and K-means.
@@ -25,6 +77,9 @@ class CustomGenerator(ColorSchemeGenerator):
         n_clusters: Number of color clusters
     """
 
+    # Extraction is in-process and keeps no shared state between images
+    concurrent_safe = True
+
     def __init__(self, settings: AppConfig):
         """Initialize CustomGenerator."""
         self.settings = settings
@@ -62,20 +117,15 @@ class CustomGenerator(ColorSchemeGenerator):
         logger.info("Generating color scheme with custom backend from %s", image_path)
 
         # Validate image
-        image_path = image_path.expanduser().resolve()
+        image_path = self._resolve_image(image_path)
         logger.debug("Resolved image path: %s", image_path)
 
-        if not image_path.exists():
-            logger.error("Image file does not exist: %s", image_path)
-            raise InvalidImageError(str(image_path), "File does not exist")
-
-        if not image_path.is_file():
-            logger.error("Path is not a file: %s", image_path)
-            raise InvalidImageError(str(image_path), "Not a file")
-
         try:
-            # Load and process image
-            img: Image.Image = Image.open(image_path).convert("RGB")
+            # Load and process image. Only a small sample is clustered, so
+            # let JPEGs decode straight at a reduced scale (no-op otherwise)
+            source = Image.open(image_path)
+            source.draft("RGB", (_SAMPLE_SIZE, _SAMPLE_SIZE))
+            img: Image.Image = source.convert("RGB")
             logger.debug("Loaded image: %s", img.size)
 
             # Extract colors using K-means
@@ -85,19 +135,19 @@ class CustomGenerator(ColorSchemeGenerator):
             # Apply saturation adjustment if specified
             saturation = config.saturation_adjustment or 1.0
             if saturation != 1.0:
-                colors = [c.adjust_saturation(saturation) for c in colors]
+                colors = Color.adjust_saturation_many(colors, saturation)
                 logger.debug("Applied saturation adjustment: %.2f", saturation)
 
-            # Ensure we have exactly 16 colors
+            # Ensure we have exactly 16 colors, padding with the first one
+            # if we have fewer
             if len(colors) < 16:
-                # Duplicate colors if we have less than 16
-                while len(colors) < 16:
-                    colors.append(colors[len(colors) % len(colors)])
+                colors += [colors[0]] * (16 - len(colors))
             elif len(colors) > 16:
                 colors = colors[:16]
 
-            # Create color scheme
-            scheme = ColorScheme(
+            # Create color scheme; the palette was padded/truncated to exactly
+            # 16 Colors above, so there is nothing left to validate
+            scheme = ColorScheme.model_construct(
                 background=colors[0],  # Darkest color
                 foreground=colors[-1],  # Brightest color
                 cursor=colors[1],  # Second color
@@ -118,28 +168,34 @@ class CustomGenerator(ColorSchemeGenerator):
 
     def _extract_colors_kmeans(self, img: Image.Image) -> list[Color]:
         """Extract colors using K-means clustering."""
-        # Resize image for faster processing
-        img_resized = img.copy()
-        img_resized.thumbnail((200, 200))
-
-        # Convert to numpy array
-        pixels = np.array(img_resized).reshape(-1, 3)
-
-        # Run K-means clustering
-        kmeans = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=10)
-        kmeans.fit(pixels)
-
-        # Get cluster centers (colors)
-        centers = kmeans.cluster_centers_.astype(int)
-
-        # Convert to Color objects
-        colors = []
-        for rgb in centers:
-            r, g, b = int(rgb[0]), int(rgb[1]), int(rgb[2])
-            hex_color = f"#{r:02X}{g:02X}{b:02X}"
-            colors.append(Color(hex=hex_color, rgb=(r, g, b)))
-
-        # Sort by brightness (sum of RGB values)
-        colors.sort(key=lambda c: sum(c.rgb))
-
-        return colors
+        bins, weights = _color_histogram(_sample_pixels(img))
+
+        if len(bins) <= self.n_clusters:
+            # Few enough distinct colors that each is its own cluster; cycle
+            # them so the palette still has n_clusters entries (sorted
+            # below) and its brightest color stays last
+            centers = np.resize(bins, (self.n_clusters, 3)).astype(int)
+        else:
+            # scikit-learn takes about a second to import; only pay for it
+            # when there is something to cluster
+            from sklearn.cluster import KMeans
+
+            # Run weighted K-means over the occupied bins. A single k-means++
+            # initialisation lands within a few percent of the best of ten
+            # restarts for a palette and is ten times cheaper; the fixed seed
+            # keeps results reproducible
+            kmeans = KMeans(n_clusters=self.n_clusters, random_state=42, n_init=1)
+            kmeans.fit(bins, sample_weight=weights)
+            centers = kmeans.cluster_centers_.astype(int)
+
+        # Sort by brightness (sum of RGB values) before building any Colors
+        centers = centers[np.argsort(centers.sum(axis=1), kind="stable")]
+
+        # Convert to Color objects; centroids of 8-bit pixels are always in
+        # range and the hex is derived from them, so skip validation
+        return [
+            Color.model_construct(
+                hex="#" + bytes((r, g, b)).hex().upper(), rgb=(r, g, b)
+            )
+            for r, g, b in centers.tolist()
+        ]
@@ -7,13 +7,24 @@ import subprocess  # nosec B404 - Required for external tool invocation
 from pathlib import Path
 from typing import Any
 
+from color_scheme.cache import SchemeCache
 from color_scheme.config.config import AppConfig
 from color_scheme.core.base import ColorSchemeGenerator
-from color_scheme.core.exceptions import ColorExtractionError, InvalidImageError
-from color_scheme.core.types import Color, ColorScheme, GeneratorConfig
+from color_scheme.core.exceptions import ColorExtractionError
+from color_scheme.core.types import ColorScheme, GeneratorConfig
 
 logger = logging.getLogger(__name__)
 
+# Pywal always writes to ~/.cache/wal/ (hardcoded)
+_WAL_CACHE_DIR = Path.home() / ".cache" / "wal"
+
+# colors.json is well under a kilobyte; anything past this is not pywal output
+_MAX_CACHE_FILE_SIZE = 1024 * 1024
+
+# pywal invocation: wal -i <image> -n --backend <algorithm>
+_WAL_CMD = ("wal", "-i")
+_WAL_FLAGS = ("-n",)  # Skip setting wallpaper
+
 
 class PywalGenerator(ColorSchemeGenerator):
     """Pywal backend for color extraction.
@@ -22,14 +33,22 @@ class PywalGenerator(ColorSchemeGenerator):
 
     Attributes:
         settings: Application configuration
+        backend_settings: Configured pywal backend settings
         cache_dir: Pywal cache directory
+        scheme_cache: Cache of previous results (None when disabled)
     """
 
     def __init__(self, settings: AppConfig):
         """Initialize PywalGenerator."""
         self.settings = settings
-        # Pywal always writes to ~/.cache/wal/ (hardcoded)
-        self.cache_dir = Path.home() / ".cache" / "wal"
+        # Resolved once; generate() only layers runtime options on top
+        self.backend_settings = settings.backends.pywal.model_dump()
+        self.cache_dir = _WAL_CACHE_DIR
+        self.scheme_cache = (
+            SchemeCache(settings.cache.directory) if settings.cache.enabled else None
+        )
+        self._available: bool | None = None
+        self._executable: str | None = None
         logger.debug("Initialized PywalGenerator with cache_dir=%s", self.cache_dir)
 
     @property
@@ -38,8 +57,16 @@ class PywalGenerator(ColorSchemeGenerator):
         return "pywal"
 
     def is_available(self) -> bool:
-        """Check if pywal is available."""
-        return shutil.which("wal") is not None
+        """Check if pywal is available.
+
+        The result is memoized per generator instance: the PATH lookup
+        for ``wal`` runs on the first call only, so a tool installed
+        afterwards is not seen until a new generator is created.
+        """
+        if self._available is None:
+            self._executable = shutil.which("wal")
+            self._available = self._executable is not None
+        return self._available
 
     def generate(self, image_path: Path, config: GeneratorConfig) -> ColorScheme:
         """Generate color scheme using pywal.
@@ -60,69 +87,30 @@ class PywalGenerator(ColorSchemeGenerator):
 
         logger.info("Generating color scheme with pywal backend from %s", image_path)
 
-        # Validate image
-        image_path = image_path.expanduser().resolve()
-
-        if not image_path.exists():
-            logger.error("Image file does not exist: %s", image_path)
-            raise InvalidImageError(str(image_path), "File does not exist")
-
-        if not image_path.is_file():
-            logger.error("Path is not a file: %s", image_path)
-            raise InvalidImageError(str(image_path), "Not a file")
+        # Validate image. This stays outside the try below: its catch-all
+        # would re-wrap InvalidImageError as ColorExtractionError, and
+        # _resolve_image() already logs the failure
+        image_path = self._resolve_image(image_path)
 
         try:
-            # Run pywal
-            backend_settings = config.get_backend_settings(self.settings)
-            backend_arg = backend_settings.get("backend_algorithm", "wal")
-
-            cmd = [
-                "wal",
-                "-i",
-                str(image_path),
-                "-n",  # Skip setting wallpaper
-                "--backend",
-                backend_arg,
-            ]
-
-            logger.debug("Running pywal command: %s", " ".join(cmd))
-            # Security: command hardcoded, image_path validated,
-            # shell=False, timeout set
-            result = subprocess.run(  # nosec B603
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            if result.returncode != 0:
-                error_msg = result.stderr or result.stdout or "Unknown error"
-                logger.error(
-                    "Pywal command failed with exit code %d: %s",
-                    result.returncode,
-                    error_msg,
-                )
-                raise subprocess.CalledProcessError(
-                    result.returncode, cmd, output=result.stdout, stderr=result.stderr
+            backend_settings = {**self.backend_settings, **config.backend_options}
+
+            # Reuse a cached result for this image and backend settings
+            cache_key = None
+            scheme = None
+            if self.scheme_cache is not None:
+                cache_key = self.scheme_cache.key(
+                    image_path, self.backend_name, backend_settings, self._executable
                 )
+                scheme = self.scheme_cache.get(cache_key, image_path, self.backend_name)
 
-            logger.debug("Pywal completed successfully")
-
-            # Read colors from cache
-            cache_file = self._get_cache_file()
-            colors_data = self._read_cache_file(cache_file)
-
-            # Parse colors
-            scheme = self._parse_colors(colors_data, image_path)
+            if scheme is None:
+                scheme = self._run_pywal(image_path, backend_settings)
+                if self.scheme_cache is not None and cache_key is not None:
+                    self.scheme_cache.put(cache_key, scheme)
 
             # Apply saturation adjustment if specified
-            saturation = config.saturation_adjustment or 1.0
-            if saturation != 1.0:
-                scheme.colors = [c.adjust_saturation(saturation) for c in scheme.colors]
-                scheme.background = scheme.background.adjust_saturation(saturation)
-                scheme.foreground = scheme.foreground.adjust_saturation(saturation)
-                scheme.cursor = scheme.cursor.adjust_saturation(saturation)
-                logger.debug("Applied saturation adjustment: %.2f", saturation)
+            self._apply_saturation(scheme, config.saturation_adjustment or 1.0)
 
             logger.info("Successfully generated color scheme")
             return scheme
@@ -141,21 +129,81 @@ class PywalGenerator(ColorSchemeGenerator):
             logger.error("Color extraction failed: %s", e)
             raise ColorExtractionError(self.backend_name, str(e)) from e
 
+    def _run_pywal(
+        self, image_path: Path, backend_settings: dict[str, Any]
+    ) -> ColorScheme:
+        """Run pywal on an image and parse the resulting colors.
+
+        Args:
+            image_path: Resolved path to source image
+            backend_settings: Pywal backend settings
+
+        Returns:
+            ColorScheme parsed from the pywal cache file
+
+        Raises:
+            subprocess.CalledProcessError: If pywal exits with an error
+            subprocess.TimeoutExpired: If pywal does not finish in time
+            ColorExtractionError: If the pywal cache file is missing or invalid
+        """
+        backend_arg = backend_settings.get("backend_algorithm", "wal")
+
+        cmd = [*_WAL_CMD, str(image_path), *_WAL_FLAGS, "--backend", backend_arg]
+
+        logger.debug("Running pywal command: %s", " ".join(cmd))
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Security: command hardcoded, image_path validated,
+        # shell=False, timeout set
+        result = subprocess.run(  # nosec B603
+            cmd,
+            # Only keep the tool's chatter when it will actually be logged
+            stdout=subprocess.PIPE if debug else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=30,
+        )
+
+        if result.returncode != 0:
+            error_msg = result.stderr or result.stdout or "Unknown error"
+            logger.error(
+                "Pywal command failed with exit code %d: %s",
+                result.returncode,
+                error_msg,
+            )
+            raise subprocess.CalledProcessError(
+                result.returncode, cmd, output=result.stdout, stderr=result.stderr
+            )
+
+        logger.debug("Pywal completed successfully")
+        if result.stdout:
+            logger.debug("Pywal output: %s", result.stdout.strip())
+
+        # Read colors from cache
+        cache_file = self._get_cache_file()
+        colors_data = self._read_cache_file(cache_file)
+
+        # Parse colors
+        return self._parse_colors(colors_data, image_path)
+
     def _get_cache_file(self) -> Path:
         """Get path to pywal cache file."""
         return self.cache_dir / "colors.json"
 
     def _read_cache_file(self, cache_file: Path) -> dict[str, Any]:
         """Read pywal cache file."""
-        if not cache_file.exists():
+        try:
+            with cache_file.open("rb") as f:
+                raw = f.read(_MAX_CACHE_FILE_SIZE + 1)
+            if len(raw) > _MAX_CACHE_FILE_SIZE:
+                raise ColorExtractionError(
+                    self.backend_name, f"Cache file too large: {cache_file}"
+                )
+            data: dict[str, Any] = json.loads(raw)
+            return data
+        except FileNotFoundError as e:
             raise ColorExtractionError(
                 self.backend_name, f"Cache file not found: {cache_file}"
-            )
-
-        try:
-            with Path(cache_file).open() as f:
-                data: dict[str, Any] = json.load(f)
-                return data
+            ) from e
         except json.JSONDecodeError as e:
             raise ColorExtractionError(
                 self.backend_name, f"Invalid JSON in cache file: {e}"
@@ -163,34 +211,6 @@ class PywalGenerator(ColorSchemeGenerator):
 
     def _parse_colors(self, data: dict[str, Any], image_path: Path) -> ColorScheme:
         """Parse colors from pywal cache data."""
-        special = data.get("special", {})
-        colors_dict = data.get("colors", {})
-
-        # Extract special colors (normalize to uppercase)
-        bg_hex = special.get("background", "#000000").upper()
-        fg_hex = special.get("foreground", "#ffffff").upper()
-        cursor_hex = special.get("cursor", "#ff0000").upper()
-
-        # Extract 16 colors
-        colors = []
-        for i in range(16):
-            color_hex = colors_dict.get(f"color{i}", "#000000").upper()
-            rgb = self._hex_to_rgb(color_hex)
-            colors.append(Color(hex=color_hex, rgb=rgb))
-
-        return ColorScheme(
-            background=Color(hex=bg_hex, rgb=self._hex_to_rgb(bg_hex)),
-            foreground=Color(hex=fg_hex, rgb=self._hex_to_rgb(fg_hex)),
-            cursor=Color(hex=cursor_hex, rgb=self._hex_to_rgb(cursor_hex)),
-            colors=colors,
-            source_image=image_path,
-            backend=self.backend_name,
+        return self._build_scheme(
+            data.get("special", {}), data.get("colors", {}), image_path
         )
-
-    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip("#")
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return (r, g, b)
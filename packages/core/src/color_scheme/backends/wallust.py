@@ -2,18 +2,31 @@
 
 import json
 import logging
+import os
 import shutil
 import subprocess  # nosec B404 - Required for external tool invocation
 from pathlib import Path
 from typing import Any
 
+from color_scheme.cache import SchemeCache
 from color_scheme.config.config import AppConfig
 from color_scheme.core.base import ColorSchemeGenerator
-from color_scheme.core.exceptions import ColorExtractionError, InvalidImageError
-from color_scheme.core.types import Color, ColorScheme, GeneratorConfig
+from color_scheme.core.exceptions import ColorExtractionError
+from color_scheme.core.types import ColorScheme, GeneratorConfig
 
 logger = logging.getLogger(__name__)
 
+# Wallust writes its palettes to hash-named subdirectories here
+_WALLUST_CACHE_DIR = Path.home() / ".cache" / "wallust"
+
+# wallust invocation: wallust run <image> --backend <type> -s -T -q
+_WALLUST_CMD = ("wallust", "run")
+_WALLUST_FLAGS = (
+    "-s",  # Skip setting terminal sequences
+    "-T",  # Skip templating
+    "-q",  # Quiet mode
+)
+
 
 class WallustGenerator(ColorSchemeGenerator):
     """Wallust backend for color extraction.
@@ -22,11 +35,20 @@ class WallustGenerator(ColorSchemeGenerator):
 
     Attributes:
         settings: Application configuration
+        backend_settings: Configured wallust backend settings
+        scheme_cache: Cache of previous results (None when disabled)
     """
 
     def __init__(self, settings: AppConfig):
         """Initialize WallustGenerator."""
         self.settings = settings
+        # Resolved once; generate() only layers runtime options on top
+        self.backend_settings = settings.backends.wallust.model_dump()
+        self.scheme_cache = (
+            SchemeCache(settings.cache.directory) if settings.cache.enabled else None
+        )
+        self._available: bool | None = None
+        self._executable: str | None = None
         logger.debug("Initialized WallustGenerator")
 
     @property
@@ -35,8 +57,16 @@ class WallustGenerator(ColorSchemeGenerator):
         return "wallust"
 
     def is_available(self) -> bool:
-        """Check if wallust is available."""
-        return shutil.which("wallust") is not None
+        """Check if wallust is available.
+
+        The result is memoized per generator instance: the PATH lookup
+        for ``wallust`` runs on the first call only, so a tool installed
+        afterwards is not seen until a new generator is created.
+        """
+        if self._available is None:
+            self._executable = shutil.which("wallust")
+            self._available = self._executable is not None
+        return self._available
 
     def generate(self, image_path: Path, config: GeneratorConfig) -> ColorScheme:
         """Generate color scheme using wallust.
@@ -57,93 +87,30 @@ class WallustGenerator(ColorSchemeGenerator):
 
         logger.info("Generating color scheme with wallust backend from %s", image_path)
 
-        # Validate image
-        image_path = image_path.expanduser().resolve()
-
-        if not image_path.exists():
-            logger.error("Image file does not exist: %s", image_path)
-            raise InvalidImageError(str(image_path), "File does not exist")
-
-        if not image_path.is_file():
-            logger.error("Path is not a file: %s", image_path)
-            raise InvalidImageError(str(image_path), "Not a file")
+        # Validate image outside the try so an invalid path is reported as
+        # InvalidImageError (already logged by _resolve_image()) rather than
+        # caught by the handler for wallust failures
+        image_path = self._resolve_image(image_path)
 
         try:
-            # Get backend settings
-            backend_settings = config.get_backend_settings(self.settings)
-            backend_type = backend_settings.get("backend_type", "resized")
-
-            # Run wallust
-            # Note: wallust doesn't output JSON to stdout,
-            # it writes to ~/.cache/wallust/
-            cmd = [
-                "wallust",
-                "run",
-                str(image_path),
-                "--backend",
-                backend_type,
-                "-s",  # Skip setting terminal sequences
-                "-T",  # Skip templating
-                "-q",  # Quiet mode
-            ]
-
-            logger.debug("Running wallust command: %s", " ".join(cmd))
-            # Security: command hardcoded, image_path validated,
-            # shell=False, timeout set
-            subprocess.run(  # nosec B603
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
-            )
-
-            logger.debug("Wallust completed successfully")
-
-            # Find and read the palette file from cache
-            cache_dir = Path.home() / ".cache" / "wallust"
-            if not cache_dir.exists():
-                raise ColorExtractionError(
-                    self.backend_name, "Wallust cache directory not found"
+            backend_settings = {**self.backend_settings, **config.backend_options}
+
+            # Reuse a cached result for this image and backend settings
+            cache_key = None
+            scheme = None
+            if self.scheme_cache is not None:
+                cache_key = self.scheme_cache.key(
+                    image_path, self.backend_name, backend_settings, self._executable
                 )
+                scheme = self.scheme_cache.get(cache_key, image_path, self.backend_name)
 
-            # Find the subdirectory (wallust creates a hash-based subdir)
-            subdirs = [d for d in cache_dir.iterdir() if d.is_dir()]
-            if not subdirs:
-                raise ColorExtractionError(
-                    self.backend_name, "No cache subdirectory found"
-                )
-
-            # Use the most recently created subdirectory
-            subdir = max(subdirs, key=lambda d: d.stat().st_mtime)
-
-            # Find the palette file (usually the one with the longest name)
-            palette_files = [
-                f for f in subdir.iterdir() if f.is_file() and f.stat().st_size < 10000
-            ]
-            if not palette_files:
-                raise ColorExtractionError(
-                    self.backend_name, "No palette file found in cache"
-                )
-
-            # Use the file with the longest name (the full palette file)
-            palette_file = max(palette_files, key=lambda f: len(f.name))
-
-            logger.debug("Reading palette from: %s", palette_file)
-            with palette_file.open() as f:
-                colors_data = json.load(f)
-
-            # Parse colors
-            scheme = self._parse_colors(colors_data, image_path)
+            if scheme is None:
+                scheme = self._run_wallust(image_path, backend_settings)
+                if self.scheme_cache is not None and cache_key is not None:
+                    self.scheme_cache.put(cache_key, scheme)
 
             # Apply saturation adjustment if specified
-            saturation = config.saturation_adjustment or 1.0
-            if saturation != 1.0:
-                scheme.colors = [c.adjust_saturation(saturation) for c in scheme.colors]
-                scheme.background = scheme.background.adjust_saturation(saturation)
-                scheme.foreground = scheme.foreground.adjust_saturation(saturation)
-                scheme.cursor = scheme.cursor.adjust_saturation(saturation)
-                logger.debug("Applied saturation adjustment: %.2f", saturation)
+            self._apply_saturation(scheme, config.saturation_adjustment or 1.0)
 
             logger.info("Successfully generated color scheme")
             return scheme
@@ -167,33 +134,123 @@ class WallustGenerator(ColorSchemeGenerator):
             logger.error("Color extraction failed: %s", e)
             raise ColorExtractionError(self.backend_name, str(e)) from e
 
-    def _parse_colors(self, data: dict[str, Any], image_path: Path) -> ColorScheme:
-        """Parse colors from wallust JSON output."""
-        # Extract special colors (normalize to uppercase)
-        bg_hex = data.get("background", "#000000").upper()
-        fg_hex = data.get("foreground", "#ffffff").upper()
-        cursor_hex = data.get("cursor", "#ff0000").upper()
-
-        # Extract 16 colors
-        colors = []
-        for i in range(16):
-            color_hex = data.get(f"color{i}", "#000000").upper()
-            rgb = self._hex_to_rgb(color_hex)
-            colors.append(Color(hex=color_hex, rgb=rgb))
-
-        return ColorScheme(
-            background=Color(hex=bg_hex, rgb=self._hex_to_rgb(bg_hex)),
-            foreground=Color(hex=fg_hex, rgb=self._hex_to_rgb(fg_hex)),
-            cursor=Color(hex=cursor_hex, rgb=self._hex_to_rgb(cursor_hex)),
-            colors=colors,
-            source_image=image_path,
-            backend=self.backend_name,
+    def _run_wallust(
+        self, image_path: Path, backend_settings: dict[str, Any]
+    ) -> ColorScheme:
+        """Run wallust on an image and parse the resulting palette.
+
+        Args:
+            image_path: Resolved path to source image
+            backend_settings: Wallust backend settings
+
+        Returns:
+            ColorScheme parsed from the wallust cache
+
+        Raises:
+            subprocess.CalledProcessError: If wallust exits with an error
+            subprocess.TimeoutExpired: If wallust does not finish in time
+            json.JSONDecodeError: If the palette file is not valid JSON
+            ColorExtractionError: If the wallust cache cannot be located
+        """
+        backend_type = backend_settings.get("backend_type", "resized")
+
+        # Run wallust
+        # Note: wallust doesn't output JSON to stdout,
+        # it writes to ~/.cache/wallust/
+        cmd = [
+            *_WALLUST_CMD,
+            str(image_path),
+            "--backend",
+            backend_type,
+            *_WALLUST_FLAGS,
+        ]
+
+        logger.debug("Running wallust command: %s", " ".join(cmd))
+        debug = logger.isEnabledFor(logging.DEBUG)
+        # Security: command hardcoded, image_path validated,
+        # shell=False, timeout set
+        result = subprocess.run(  # nosec B603
+            cmd,
+            # Only keep the tool's chatter when it will actually be logged
+            stdout=subprocess.PIPE if debug else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+            timeout=30,
         )
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip("#")
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return (r, g, b)
+        logger.debug("Wallust completed successfully")
+        if result.stdout:
+            logger.debug("Wallust output: %s", result.stdout.strip())
+
+        # Find and read the palette file from cache
+        cache_dir = _WALLUST_CACHE_DIR
+        if not cache_dir.exists():
+            raise ColorExtractionError(
+                self.backend_name, "Wallust cache directory not found"
+            )
+
+        # Find the subdirectory (wallust creates a hash-based subdir)
+        subdir = self._latest_subdir(cache_dir)
+        if subdir is None:
+            raise ColorExtractionError(self.backend_name, "No cache subdirectory found")
+
+        # Find the palette file (usually the one with the longest name)
+        palette_file = self._find_palette_file(subdir)
+        if palette_file is None:
+            raise ColorExtractionError(
+                self.backend_name, "No palette file found in cache"
+            )
+
+        logger.debug("Reading palette from: %s", palette_file)
+        colors_data = json.loads(palette_file.read_bytes())
+
+        # Parse colors
+        return self._parse_colors(colors_data, image_path)
+
+    def _latest_subdir(self, cache_dir: Path) -> Path | None:
+        """Find the most recently modified subdirectory in one scan.
+
+        Args:
+            cache_dir: Wallust cache directory
+
+        Returns:
+            Newest subdirectory, or None if there are none
+        """
+        latest: str | None = None
+        latest_mtime = float("-inf")
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.path, mtime
+        return Path(latest) if latest is not None else None
+
+    def _find_palette_file(self, subdir: Path) -> Path | None:
+        """Find the palette file in a wallust cache subdirectory.
+
+        Wallust stores small JSON palettes next to larger cache blobs; the
+        full palette is the small file with the longest name.
+
+        Args:
+            subdir: Wallust cache subdirectory
+
+        Returns:
+            Palette file path, or None if no candidate exists
+        """
+        palette: str | None = None
+        palette_name_len = -1
+        with os.scandir(subdir) as entries:
+            for entry in entries:
+                if len(entry.name) <= palette_name_len or not entry.is_file():
+                    continue
+                if entry.stat().st_size < 10000:
+                    palette, palette_name_len = entry.path, len(entry.name)
+        return Path(palette) if palette is not None else None
+
+    def _parse_colors(self, data: dict[str, Any], image_path: Path) -> ColorScheme:
+        """Parse colors from wallust JSON output."""
+        # Wallust keeps special and terminal colors in one flat mapping
+        return self._build_scheme(data, data, image_path)
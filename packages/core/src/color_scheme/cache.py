@@ -0,0 +1,215 @@
+"""Content-addressed cache for backend color extraction results."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from color_scheme.core.types import ColorScheme
+
+logger = logging.getLogger(__name__)
+
+# Read size used when hashing image contents
+_CHUNK_SIZE = 64 * 1024
+
+# Fields persisted for a cached scheme (metadata is rebuilt on every hit)
+_CACHED_FIELDS = {"background", "foreground", "cursor", "colors"}
+
+# Part of every key; bump when cached schemes must no longer be reused
+# (stored format or extraction changes)
+_CACHE_VERSION = 1
+
+# Most image digests remembered in the index
+_MAX_INDEX_ENTRIES = 1024
+
+
+def _hash_file(path: Path) -> str:
+    """Compute the SHA-256 digest of a file, reading it in chunks."""
+    sha = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _tool_fingerprint(executable: str | None) -> str:
+    """Identify an installed backend tool by its path, size and mtime.
+
+    Reinstalling or upgrading the tool rewrites its executable, which
+    changes the fingerprint without running the tool to ask its version.
+    """
+    if executable is None:
+        return ""
+    try:
+        st = Path(executable).stat()
+    except OSError:
+        return executable
+    return f"{executable}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file via a temporary sibling so readers never see it partial.
+
+    Concurrent runs may both write the same file; the atomic rename makes the
+    last writer win instead of interleaving their contents.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class SchemeCache:
+    """Cache of extracted color schemes keyed by image content.
+
+    Entries are keyed by the SHA-256 of the image bytes combined with the
+    backend name, its settings and a fingerprint of the installed tool, so
+    renaming or moving an image still hits the cache while editing it or
+    upgrading the tool does not. Image digests are remembered together with
+    the file size and mtime, which lets unchanged files skip re-hashing
+    entirely.
+
+    Cache failures are never fatal: unreadable or corrupt entries are
+    treated as misses. Files are replaced atomically so concurrent runs
+    cannot corrupt them, and the digest index is pruned to the most
+    recently hashed images.
+
+    Attributes:
+        cache_dir: Directory holding cached schemes and the digest index
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialize SchemeCache.
+
+        Args:
+            cache_dir: Directory holding cached schemes and the digest index
+        """
+        self.cache_dir = cache_dir.expanduser()
+        self._index_file = self.cache_dir / "index.json"
+        self._index: dict[str, list[Any]] | None = None
+
+    def key(
+        self,
+        image_path: Path,
+        backend: str,
+        backend_settings: dict[str, Any],
+        executable: str | None = None,
+    ) -> str:
+        """Compute the cache key for an image and backend configuration.
+
+        Args:
+            image_path: Resolved path to the source image
+            backend: Backend name (e.g., "pywal")
+            backend_settings: Backend settings affecting extraction
+            executable: Path of the backend tool, so upgrading it
+                invalidates its cached results
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        settings_repr = json.dumps(backend_settings, sort_keys=True, default=str)
+        payload = (
+            f"{_CACHE_VERSION}:{self._image_digest(image_path)}:{backend}:"
+            f"{_tool_fingerprint(executable)}:{settings_repr}"
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, image_path: Path, backend: str) -> ColorScheme | None:
+        """Load a cached color scheme.
+
+        Args:
+            key: Cache key from key()
+            image_path: Source image to record on the returned scheme
+            backend: Backend name to record on the returned scheme
+
+        Returns:
+            Cached ColorScheme, or None on a miss
+        """
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            data = json.loads(entry.read_bytes())
+            scheme = ColorScheme.model_validate(
+                {**data, "source_image": image_path, "backend": backend}
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, ValidationError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", entry, e)
+            return None
+
+        logger.debug("Scheme cache hit: %s", entry)
+        return scheme
+
+    def put(self, key: str, scheme: ColorScheme) -> None:
+        """Store a color scheme in the cache.
+
+        Args:
+            key: Cache key from key()
+            scheme: ColorScheme to store
+        """
+        entry = self.cache_dir / f"{key}.json"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(entry, scheme.model_dump_json(include=_CACHED_FIELDS))
+        except OSError as e:
+            logger.debug("Failed to write cache entry %s: %s", entry, e)
+
+    def _image_digest(self, image_path: Path) -> str:
+        """Get the SHA-256 digest of an image, reusing it if unchanged."""
+        st = image_path.stat()
+        index = self._load_index()
+        path_key = str(image_path)
+
+        known = index.get(path_key)
+        if known is not None and known[:2] == [st.st_size, st.st_mtime_ns]:
+            digest: str = known[2]
+            return digest
+
+        digest = _hash_file(image_path)
+        # Re-insert so the index stays ordered from least to most recent
+        index.pop(path_key, None)
+        index[path_key] = [st.st_size, st.st_mtime_ns, digest]
+        self._prune_index(index)
+        self._save_index(index)
+        return digest
+
+    def _load_index(self) -> dict[str, list[Any]]:
+        """Load the path -> (size, mtime, digest) index."""
+        if self._index is None:
+            try:
+                data = json.loads(self._index_file.read_bytes())
+                self._index = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _prune_index(self, index: dict[str, list[Any]]) -> None:
+        """Keep the index within _MAX_INDEX_ENTRIES.
+
+        Entries for images that no longer exist go first, then the least
+        recently hashed ones.
+        """
+        if len(index) <= _MAX_INDEX_ENTRIES:
+            return
+
+        for path_key in [p for p in index if not Path(p).exists()]:
+            del index[path_key]
+        for path_key in list(index)[: len(index) - _MAX_INDEX_ENTRIES]:
+            del index[path_key]
+
+    def _save_index(self, index: dict[str, list[Any]]) -> None:
+        """Persist the digest index."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self._index_file, json.dumps(index))
+        except OSError as e:
+            logger.debug("Failed to write cache index %s: %s", self._index_file, e)
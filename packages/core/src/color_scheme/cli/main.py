@@ -1,6 +1,10 @@
 """CLI entry point for color-scheme."""
 
+import errno
 import logging
+import stat
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Protocol, cast
 
@@ -21,7 +25,7 @@ from color_scheme.core.exceptions import (
     OutputWriteError,
     TemplateRenderError,
 )
-from color_scheme.core.types import GeneratorConfig
+from color_scheme.core.types import Color, GeneratorConfig
 from color_scheme.factory import BackendFactory
 from color_scheme.output.manager import OutputManager
 
@@ -49,9 +53,122 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
+# All styling is explicit markup; skip Rich's regex highlighter on every print
+console = Console(highlight=False)
 logger = logging.getLogger(__name__)
 
+# Parameters shared by the generate and show commands
+_IMAGE_PATH_ARGUMENT = typer.Argument(
+    ...,
+    help="Path to source image",
+)
+_BACKEND_OPTION = typer.Option(
+    None,
+    "--backend",
+    "-b",
+    help="Backend to use for color extraction (auto-detects if not specified)",
+)
+_SATURATION_OPTION = typer.Option(
+    None,
+    "--saturation",
+    "-s",
+    min=0.0,
+    max=2.0,
+    help="Saturation adjustment factor (0.0-2.0, default from settings)",
+)
+_DRY_RUN_OPTION = typer.Option(
+    False,
+    "--dry-run",
+    "-n",
+    help="Show what would be done without executing",
+)
+_DISPLAY_IMAGE_PATH_OPTION = typer.Option(
+    None,
+    "--display-image-path",
+    help="Override the image path shown in status messages (used by orchestrator)",
+    hidden=True,
+)
+
+# Width of the color preview cell in the show tables
+_PREVIEW_WIDTH = 10
+_PREVIEW_SWATCH = " " * _PREVIEW_WIDTH
+
+
+# Table column specs: (header, style, width)
+_ColumnSpec = tuple[str, str | None, int | None]
+_FILES_COLUMNS: tuple[_ColumnSpec, ...] = (
+    ("Format", "cyan", None),
+    ("File Path", "green", None),
+)
+_SPECIAL_COLUMNS: tuple[_ColumnSpec, ...] = (
+    ("Color", "cyan", None),
+    ("Preview", None, _PREVIEW_WIDTH),
+    ("Hex", "white", None),
+    ("RGB", "white", None),
+)
+_TERMINAL_COLUMNS: tuple[_ColumnSpec, ...] = (
+    ("Index", "cyan", 6),
+    ("Name", "cyan", None),
+    ("Preview", None, _PREVIEW_WIDTH),
+    ("Hex", "white", None),
+    ("RGB", "white", None),
+)
+
+
+def _new_table(title: str, columns: tuple[_ColumnSpec, ...]) -> Table:
+    """Create a table with the given title and column specs."""
+    table = Table(title=title, show_header=True)
+    for header, style, width in columns:
+        table.add_column(header, style=style or "", width=width)
+    return table
+
+
+@lru_cache(maxsize=32)
+def _cells_for(hex_color: str, rgb: tuple[int, int, int]) -> tuple[str, str]:
+    """Format the preview swatch and RGB cells for a color, cached by value."""
+    r, g, b = rgb
+    return (
+        f"[on {hex_color}]{_PREVIEW_SWATCH}[/]",
+        f"rgb({r}, {g}, {b})",
+    )
+
+
+def _color_cells(color: Color) -> tuple[str, str]:
+    """Format the preview swatch and RGB cells for a color table row."""
+    return _cells_for(color.hex, tuple(color.rgb))
+
+
+# stat() errors meaning the path does not lead to a file
+_MISSING_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP})
+
+
+def _validate_image_path(image_path: Path) -> None:
+    """Exit with an error unless image_path is an existing regular file.
+
+    Uses a single stat() rather than separate exists()/is_file() checks.
+    Paths that exists() would have reported as missing (including symlink
+    loops and embedded NUL bytes) are reported as not found.
+
+    Raises:
+        typer.Exit: If the path does not exist, cannot be accessed or is not
+            a file
+    """
+    try:
+        mode = image_path.stat().st_mode
+    except (OSError, ValueError) as e:
+        if isinstance(e, OSError) and e.errno not in _MISSING_PATH_ERRNOS:
+            console.print(
+                f"[red]Error:[/red] Cannot access image file: {image_path} "
+                f"({e.strerror})"
+            )
+        else:
+            console.print(f"[red]Error:[/red] Image file not found: {image_path}")
+        raise typer.Exit(1) from None
+
+    if not stat.S_ISREG(mode):
+        console.print(f"[red]Error:[/red] Path is not a file: {image_path}")
+        raise typer.Exit(1)
+
 
 @app.command()
 def version() -> None:
@@ -63,53 +180,28 @@ def version() -> None:
 
 @app.command()
 def generate(
-    image_path: Path = typer.Argument(
-        ...,
-        help="Path to source image",
-    ),
+    image_path: Path = _IMAGE_PATH_ARGUMENT,
     output_dir: Path | None = typer.Option(
         None,
         "--output-dir",
         "-o",
         help="Output directory for color scheme files",
     ),
-    backend: Backend | None = typer.Option(
-        None,
-        "--backend",
-        "-b",
-        help="Backend to use for color extraction (auto-detects if not specified)",
-    ),
+    backend: Backend | None = _BACKEND_OPTION,
     formats: list[ColorFormat] | None = typer.Option(
         None,
         "--format",
         "-f",
         help="Output format(s) to generate (can be specified multiple times)",
     ),
-    saturation: float | None = typer.Option(
-        None,
-        "--saturation",
-        "-s",
-        min=0.0,
-        max=2.0,
-        help="Saturation adjustment factor (0.0-2.0, default from settings)",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be done without executing",
-    ),
+    saturation: float | None = _SATURATION_OPTION,
+    dry_run: bool = _DRY_RUN_OPTION,
     no_summary: bool = typer.Option(
         False,
         "--no-summary",
         help="Suppress the success message and generated files table",
     ),
-    display_image_path: str | None = typer.Option(
-        None,
-        "--display-image-path",
-        help="Override the image path shown in status messages (used by orchestrator)",
-        hidden=True,
-    ),
+    display_image_path: str | None = _DISPLAY_IMAGE_PATH_OPTION,
     display_output_dir: str | None = typer.Option(
         None,
         "--display-output-dir",
@@ -174,13 +266,7 @@ def generate(
         config = cast(HasCoreConfig, get_config())
 
         # Validate image path
-        if not image_path.exists():
-            console.print(f"[red]Error:[/red] Image file not found: {image_path}")
-            raise typer.Exit(1)
-
-        if not image_path.is_file():
-            console.print(f"[red]Error:[/red] Path is not a file: {image_path}")
-            raise typer.Exit(1)
+        _validate_image_path(image_path)
 
         # Create backend factory
         factory = BackendFactory(config.core)
@@ -192,8 +278,8 @@ def generate(
         else:
             console.print(f"[cyan]Using backend:[/cyan] {backend.value}")
 
-        # Build GeneratorConfig with overrides
-        overrides: dict[str, Any] = {}
+        # Build GeneratorConfig with overrides; the backend is already resolved
+        overrides: dict[str, Any] = {"backend": backend}
         if output_dir is not None:
             overrides["output_dir"] = output_dir
         if saturation is not None:
@@ -233,9 +319,7 @@ def generate(
             console.print("\n[green]Generated color scheme successfully![/green]\n")
 
             # Create table of generated files
-            table = Table(title="Generated Files")
-            table.add_column("Format", style="cyan")
-            table.add_column("File Path", style="green")
+            table = _new_table("Generated Files", _FILES_COLUMNS)
 
             for fmt in generator_config.formats:
                 file_path = generator_config.output_dir / f"colors.{fmt.value}"
@@ -292,36 +376,11 @@ def generate(
 
 @app.command()
 def show(
-    image_path: Path = typer.Argument(
-        ...,
-        help="Path to source image",
-    ),
-    backend: Backend | None = typer.Option(
-        None,
-        "--backend",
-        "-b",
-        help="Backend to use for color extraction (auto-detects if not specified)",
-    ),
-    saturation: float | None = typer.Option(
-        None,
-        "--saturation",
-        "-s",
-        min=0.0,
-        max=2.0,
-        help="Saturation adjustment factor (0.0-2.0, default from settings)",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be done without executing",
-    ),
-    display_image_path: str | None = typer.Option(
-        None,
-        "--display-image-path",
-        help="Override the image path shown in status messages (used by orchestrator)",
-        hidden=True,
-    ),
+    image_path: Path = _IMAGE_PATH_ARGUMENT,
+    backend: Backend | None = _BACKEND_OPTION,
+    saturation: float | None = _SATURATION_OPTION,
+    dry_run: bool = _DRY_RUN_OPTION,
+    display_image_path: str | None = _DISPLAY_IMAGE_PATH_OPTION,
 ) -> None:
     """Display color scheme from an image in the terminal.
 
@@ -374,13 +433,7 @@ def show(
         config = cast(HasCoreConfig, get_config())
 
         # Validate image path
-        if not image_path.exists():
-            console.print(f"[red]Error:[/red] Image file not found: {image_path}")
-            raise typer.Exit(1)
-
-        if not image_path.is_file():
-            console.print(f"[red]Error:[/red] Path is not a file: {image_path}")
-            raise typer.Exit(1)
+        _validate_image_path(image_path)
 
         # Create backend factory
         factory = BackendFactory(config.core)
@@ -390,8 +443,8 @@ def show(
         if backend is None:
             backend = factory.auto_detect()
 
-        # Build GeneratorConfig with overrides
-        overrides = {}
+        # Build GeneratorConfig with overrides; the backend is already resolved
+        overrides: dict[str, Any] = {"backend": backend}
         if saturation is not None:
             overrides["saturation_adjustment"] = saturation
 
@@ -401,19 +454,24 @@ def show(
         generator = factory.create(backend)
         color_scheme = generator.generate(image_path, generator_config)
 
+        # Saturation is only reported when it actually changes the colors
+        saturation = generator_config.saturation_adjustment
+        if saturation == 1.0:
+            saturation = None
+
         if not console.is_terminal:
-            # Non-TTY: pure data bullet list, no preamble, no Rich markup
-            print(f"backend: {backend.value}")
-            if (
-                generator_config.saturation_adjustment is not None
-                and generator_config.saturation_adjustment != 1.0
-            ):
-                print(f"saturation: {generator_config.saturation_adjustment}")
-            print(f"background: {color_scheme.background.hex}")
-            print(f"foreground: {color_scheme.foreground.hex}")
-            print(f"cursor: {color_scheme.cursor.hex}")
-            for i, color in enumerate(color_scheme.colors):
-                print(f"color{i}: {color.hex}")
+            # Non-TTY: pure data bullet list, no preamble, no Rich markup,
+            # written in one call
+            lines = [f"backend: {backend.value}"]
+            if saturation is not None:
+                lines.append(f"saturation: {saturation}")
+            lines.append(f"background: {color_scheme.background.hex}")
+            lines.append(f"foreground: {color_scheme.foreground.hex}")
+            lines.append(f"cursor: {color_scheme.cursor.hex}")
+            lines.extend(
+                f"color{i}: {color.hex}" for i, color in enumerate(color_scheme.colors)
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             # TTY: full preamble + Rich tables
             if auto_detected:
@@ -424,68 +482,46 @@ def show(
             shown_image = display_image_path or image_path
             console.print(f"[cyan]Extracting colors from:[/cyan] {shown_image}")
 
-            if (
-                generator_config.saturation_adjustment is not None
-                and generator_config.saturation_adjustment != 1.0
-            ):
-                console.print(
-                    "[cyan]Adjusting saturation:[/cyan] "
-                    f"{generator_config.saturation_adjustment}"
-                )
+            if saturation is not None:
+                console.print(f"[cyan]Adjusting saturation:[/cyan] {saturation}")
 
             console.print()
 
-            info_lines = [
-                f"[cyan]Source Image:[/cyan] {display_image_path or image_path}",
-                f"[cyan]Backend:[/cyan] {backend.value}",
-            ]
-            if (
-                generator_config.saturation_adjustment is not None
-                and generator_config.saturation_adjustment != 1.0
-            ):
-                info_lines.append(
-                    f"[cyan]Saturation:[/cyan] {generator_config.saturation_adjustment}"
-                )
+            info = (
+                f"[cyan]Source Image:[/cyan] {shown_image}\n"
+                f"[cyan]Backend:[/cyan] {backend.value}"
+            )
+            if saturation is not None:
+                info += f"\n[cyan]Saturation:[/cyan] {saturation}"
 
             info_panel = Panel(
-                "\n".join(info_lines),
+                info,
                 title="Color Scheme Information",
                 border_style="cyan",
             )
             console.print(info_panel)
             console.print()
 
-            special_table = Table(title="Special Colors", show_header=True)
-            special_table.add_column("Color", style="cyan")
-            special_table.add_column("Preview", width=10)
-            special_table.add_column("Hex", style="white")
-            special_table.add_column("RGB", style="white")
+            special_table = _new_table("Special Colors", _SPECIAL_COLUMNS)
 
             for name, color in [
                 ("Background", color_scheme.background),
                 ("Foreground", color_scheme.foreground),
                 ("Cursor", color_scheme.cursor),
             ]:
-                preview = f"[on {color.hex}]          [/]"
-                rgb_str = f"rgb({color.rgb[0]}, {color.rgb[1]}, {color.rgb[2]})"
+                preview, rgb_str = _color_cells(color)
                 special_table.add_row(name, preview, color.hex, rgb_str)
 
             console.print(special_table)
             console.print()
 
-            terminal_table = Table(title="Terminal Colors (ANSI)", show_header=True)
-            terminal_table.add_column("Index", style="cyan", width=6)
-            terminal_table.add_column("Name", style="cyan")
-            terminal_table.add_column("Preview", width=10)
-            terminal_table.add_column("Hex", style="white")
-            terminal_table.add_column("RGB", style="white")
+            terminal_table = _new_table("Terminal Colors (ANSI)", _TERMINAL_COLUMNS)
 
-            color_names = [f"color {i}" for i in range(16)]
-
-            for idx, (name, color) in enumerate(zip(color_names, color_scheme.colors)):
-                preview = f"[on {color.hex}]          [/]"
-                rgb_str = f"rgb({color.rgb[0]}, {color.rgb[1]}, {color.rgb[2]})"
-                terminal_table.add_row(str(idx), name, preview, color.hex, rgb_str)
+            for idx, color in enumerate(color_scheme.colors):
+                preview, rgb_str = _color_cells(color)
+                terminal_table.add_row(
+                    str(idx), f"color {idx}", preview, color.hex, rgb_str
+                )
 
             console.print(terminal_table)
 
@@ -11,6 +11,8 @@ from pathlib import Path
 from pydantic import BaseModel, Field, field_validator
 
 from color_scheme.config.defaults import (
+    cache_directory,
+    cache_enabled,
     custom_algorithm,
     custom_n_clusters,
     default_backend,
@@ -23,6 +25,15 @@ from color_scheme.config.defaults import (
 )
 from color_scheme.config.enums import Backend, ColorAlgorithm
 
+# Accepted logging level names and their numeric values
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 class LoggingSettings(BaseModel):
     """Logging configuration.
@@ -47,12 +58,11 @@ class LoggingSettings(BaseModel):
     @classmethod
     def validate_level(cls, v: str) -> str:
         """Validate logging level is valid."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
         v_upper = v.upper()
-        if v_upper not in valid_levels:
+        if v_upper not in _LEVELS:
             raise ValueError(
                 f"Invalid logging level: {v}. "
-                f"Must be one of: {', '.join(sorted(valid_levels))}"
+                f"Must be one of: {', '.join(sorted(_LEVELS))}"
             )
         return v_upper
 
@@ -62,8 +72,7 @@ class LoggingSettings(BaseModel):
         Returns:
             Python logging level constant
         """
-        level_value: int = getattr(logging, self.level)
-        return level_value
+        return _LEVELS[self.level]
 
 
 class OutputSettings(BaseModel):
@@ -208,6 +217,23 @@ class TemplateSettings(BaseModel):
     )
 
 
+class CacheSettings(BaseModel):
+    """Scheme cache configuration (for external backends).
+
+    Pywal and wallust results are cached by image content so that
+    repeated runs on the same image skip the external process.
+    """
+
+    enabled: bool = Field(
+        default=cache_enabled,
+        description="Reuse cached backend results for unchanged images",
+    )
+    directory: Path = Field(
+        default=cache_directory,
+        description="Directory where cached color schemes are stored",
+    )
+
+
 class AppConfig(BaseModel):
     """Application configuration matching dynaconf structure.
 
@@ -236,3 +262,7 @@ class AppConfig(BaseModel):
         default_factory=TemplateSettings,
         description="Template configuration (OutputManager)",
     )
+    cache: CacheSettings = Field(
+        default_factory=CacheSettings,
+        description="Scheme cache configuration (pywal, wallust)",
+    )
@@ -31,6 +31,11 @@ wallust_backend_type = "resized"
 custom_algorithm = "kmeans"
 custom_n_clusters = 16
 
+# Cache defaults
+cache_enabled = True
+# Expanded where it is used, so the home directory is read at run time
+cache_directory = Path("~/.cache/color-scheme")
+
 # Template defaults
 # Priority:
 # 1. Environment variable COLOR_SCHEME_TEMPLATES
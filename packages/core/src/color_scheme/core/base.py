@@ -1,17 +1,36 @@
 """Abstract base class for color scheme generators."""
 
+import logging
+import os
+import stat
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
-from color_scheme.core.types import ColorScheme, GeneratorConfig
+from color_scheme.core.exceptions import BackendNotAvailableError, InvalidImageError
+from color_scheme.core.types import Color, ColorScheme, GeneratorConfig
+
+logger = logging.getLogger(__name__)
+
+# Keys of the 16 terminal colors in pywal/wallust output
+_COLOR_KEYS = tuple(f"color{i}" for i in range(16))
 
 
 class ColorSchemeGenerator(ABC):
     """Abstract base class for color scheme generators.
 
     All backend implementations must inherit from this class.
+
+    Attributes:
+        concurrent_safe: Whether generate() may run for several images at
+            once. Backends driving external tools that write to a fixed
+            output location must leave this False.
     """
 
+    concurrent_safe: bool = False
+
     @abstractmethod
     def generate(self, image_path: Path, config: GeneratorConfig) -> ColorScheme:
         """Generate color scheme from image.
@@ -49,16 +68,164 @@ class ColorSchemeGenerator(ABC):
         """
         pass
 
+    def _resolve_image(self, image_path: Path) -> Path:
+        """Resolve an image path and check that it is a regular file.
+
+        Args:
+            image_path: Path to the source image
+
+        Returns:
+            Absolute, resolved image path
+
+        Raises:
+            InvalidImageError: If the path does not exist, cannot be accessed
+                or is not a file
+        """
+        image_path = image_path.expanduser()
+
+        # A single stat answers both "exists" and "is a file"
+        try:
+            image_path = image_path.resolve()
+            mode = image_path.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError) as e:
+            logger.error("Image file does not exist: %s", image_path)
+            raise InvalidImageError(str(image_path), "File does not exist") from e
+        except (OSError, RuntimeError) as e:
+            # Permission denied, or a symlink loop (RuntimeError from resolve)
+            logger.error("Cannot access image file %s: %s", image_path, e)
+            reason = e.strerror if isinstance(e, OSError) else str(e)
+            raise InvalidImageError(
+                str(image_path), f"Cannot access file: {reason}"
+            ) from e
+
+        if not stat.S_ISREG(mode):
+            logger.error("Path is not a file: %s", image_path)
+            raise InvalidImageError(str(image_path), "Not a file")
+
+        return image_path
+
+    def _hex_to_rgb(self, hex_color: str) -> tuple[int, int, int]:
+        """Convert hex color to RGB tuple."""
+        # Backends emit "#rrggbb"; slicing skips the lstrip scan
+        if len(hex_color) == 7 and hex_color[0] == "#":
+            r, g, b = bytes.fromhex(hex_color[1:])
+        else:
+            r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+        return (r, g, b)
+
+    def _make_color(self, hex_color: str) -> Color:
+        """Build a Color from a backend hex string.
+
+        Args:
+            hex_color: Hex color code from backend output
+
+        Returns:
+            Color with RGB decoded from the hex code
+
+        Raises:
+            ValueError: If hex_color is not a valid hex color
+        """
+        rgb = self._hex_to_rgb(hex_color)
+        if len(hex_color) == 7 and hex_color[0] == "#":
+            # "#" plus six digits that decoded to rgb is exactly what the
+            # Color validators check, so skip running them again
+            return Color.model_construct(hex=hex_color, rgb=rgb)
+        return Color(hex=hex_color, rgb=rgb)
+
+    def _build_scheme(
+        self,
+        special: dict[str, Any],
+        colors_dict: dict[str, Any],
+        image_path: Path,
+    ) -> ColorScheme:
+        """Build a ColorScheme from pywal/wallust style color mappings.
+
+        Args:
+            special: Mapping with "background", "foreground" and "cursor"
+            colors_dict: Mapping with "color0" through "color15"
+            image_path: Source image to record on the scheme
+
+        Returns:
+            ColorScheme with uppercase hex colors; missing entries fall back
+            to defaults
+        """
+        bg_hex = special.get("background", "#000000").upper()
+        fg_hex = special.get("foreground", "#ffffff").upper()
+        cursor_hex = special.get("cursor", "#ff0000").upper()
+
+        hexes = [colors_dict.get(key, "#000000").upper() for key in _COLOR_KEYS]
+        colors = [self._make_color(h) for h in hexes]
+
+        # Every field is built here: exactly 16 Colors (already validated or
+        # known-good), a resolved Path and the backend name
+        return ColorScheme.model_construct(
+            background=self._make_color(bg_hex),
+            foreground=self._make_color(fg_hex),
+            cursor=self._make_color(cursor_hex),
+            colors=colors,
+            source_image=image_path,
+            backend=self.backend_name,
+        )
+
+    def _apply_saturation(self, scheme: ColorScheme, factor: float) -> None:
+        """Adjust the saturation of every color in a scheme in place.
+
+        Args:
+            scheme: ColorScheme to adjust
+            factor: Saturation multiplier (1.0 leaves colors unchanged)
+        """
+        if factor == 1.0:
+            return
+        adjusted = Color.adjust_saturation_many(
+            [scheme.background, scheme.foreground, scheme.cursor, *scheme.colors],
+            factor,
+        )
+        scheme.background, scheme.foreground, scheme.cursor = adjusted[:3]
+        scheme.colors = adjusted[3:]
+        logger.debug("Applied saturation adjustment: %.2f", factor)
+
     def ensure_available(self) -> None:
         """Ensure backend is available, raise error if not.
 
         Raises:
             BackendNotAvailableError: If backend is not available
         """
-        from color_scheme.core.exceptions import BackendNotAvailableError
-
         if not self.is_available():
             raise BackendNotAvailableError(
                 self.backend_name,
                 f"{self.backend_name} is not installed or not in PATH",
             )
+
+    def generate_many(
+        self,
+        image_paths: Sequence[Path],
+        config: GeneratorConfig,
+        max_workers: int | None = None,
+    ) -> list[ColorScheme]:
+        """Generate color schemes for several images.
+
+        Images are processed in parallel when the backend is concurrent_safe,
+        otherwise one after another.
+
+        Args:
+            image_paths: Paths to the source images
+            config: Runtime configuration for generation
+            max_workers: Maximum number of parallel generations
+                (defaults to the CPU count)
+
+        Returns:
+            ColorScheme objects in the same order as image_paths
+
+        Raises:
+            InvalidImageError: If an image cannot be read or is invalid
+            ColorExtractionError: If color extraction fails
+            BackendNotAvailableError: If backend is not available
+        """
+        if not self.concurrent_safe or len(image_paths) < 2:
+            return [self.generate(path, config) for path in image_paths]
+
+        workers = min(len(image_paths), max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda path: self.generate(path, config), image_paths)
+            )
@@ -20,6 +20,9 @@ class BackendFactory:
     - Detect available backends
     - Auto-detect the best available backend
 
+    Generators are created once per backend and reused, so availability
+    probes made during detection are not repeated by create().
+
     Attributes:
         settings: Application configuration
     """
@@ -31,6 +34,7 @@ class BackendFactory:
             settings: Application configuration
         """
         self.settings = settings
+        self._generators: dict[Backend, ColorSchemeGenerator] = {}
         logger.debug("Initialized BackendFactory")
 
     def _instantiate_generator(self, backend: Backend) -> ColorSchemeGenerator:
@@ -54,6 +58,21 @@ class BackendFactory:
         else:
             raise ValueError(f"Unknown backend: {backend}")
 
+    def _get_generator(self, backend: Backend) -> ColorSchemeGenerator:
+        """Get the generator for a backend, instantiating it on first use.
+
+        Args:
+            backend: Backend to get
+
+        Returns:
+            ColorSchemeGenerator instance shared by this factory
+        """
+        generator = self._generators.get(backend)
+        if generator is None:
+            generator = self._instantiate_generator(backend)
+            self._generators[backend] = generator
+        return generator
+
     def create(self, backend: Backend) -> ColorSchemeGenerator:
         """Create a generator for the specified backend.
 
@@ -73,7 +92,7 @@ class BackendFactory:
         """
         logger.debug("Creating generator for backend: %s", backend.value)
 
-        generator = self._instantiate_generator(backend)
+        generator = self._get_generator(backend)
 
         # Ensure backend is available
         generator.ensure_available()
@@ -97,7 +116,7 @@ class BackendFactory:
 
         for backend in Backend:
             try:
-                generator = self._instantiate_generator(backend)
+                generator = self._get_generator(backend)
 
                 if generator.is_available():
                     available.append(backend)
@@ -129,7 +148,7 @@ class BackendFactory:
         # Check in preference order
         for backend in [Backend.WALLUST, Backend.PYWAL, Backend.CUSTOM]:
             try:
-                generator = self._instantiate_generator(backend)
+                generator = self._get_generator(backend)
 
                 if generator.is_available():
                     logger.info("Auto-detected backend: %s", backend.value)
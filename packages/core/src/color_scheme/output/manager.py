@@ -1,14 +1,31 @@
 """OutputManager for writing color schemes to files."""
 
+import logging
+import os
+import stat
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound
+from typing import Any
+
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    TemplateNotFound,
+)
 
 from color_scheme.config.config import AppConfig
 from color_scheme.config.enums import ColorFormat
 from color_scheme.core.exceptions import OutputWriteError, TemplateRenderError
 from color_scheme.core.types import ColorScheme
 
+logger = logging.getLogger(__name__)
+
+# Sequences template placeholders: ] becomes ESC] and \ becomes ESC\
+_ESCAPE_SEQUENCES = str.maketrans({"]": "\x1b]", "\\": "\x1b\\"})
+
 
 class OutputManager:
     """Manages writing color schemes to files using Jinja2 templates.
@@ -48,8 +65,48 @@ class OutputManager:
             undefined=StrictUndefined,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=self._bytecode_cache(),
+            # Templates don't change while a run is in progress
+            auto_reload=False,
         )
 
+    def _bytecode_cache(self) -> BytecodeCache | None:
+        """Create the on-disk cache of compiled templates.
+
+        Compiling the templates dominates rendering for a single scheme;
+        caching the bytecode lets later runs skip it.
+
+        Jinja executes the cached bytecode, so the directory is created
+        private (0700) and is only used if it belongs to the current user
+        and nobody else can write to it. The cache is just an optimization:
+        when the directory cannot be created or is not safe, a warning is
+        logged and templates are compiled in memory.
+
+        Returns:
+            Bytecode cache in the scheme cache directory, or None if caching
+            is disabled or the directory cannot be created or trusted
+        """
+        if not self.settings.cache.enabled:
+            return None
+
+        cache_dir = self.settings.cache.directory.expanduser() / "jinja"
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = cache_dir.stat()
+        except OSError as e:
+            logger.warning(
+                "Template cache disabled, cannot create %s: %s", cache_dir, e
+            )
+            return None
+
+        if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            logger.warning(
+                "Template cache disabled, %s is not private to the current user",
+                cache_dir,
+            )
+            return None
+        return FileSystemBytecodeCache(str(cache_dir))
+
     def write_outputs(
         self,
         color_scheme: ColorScheme,
@@ -67,23 +124,29 @@ class OutputManager:
             TemplateRenderError: If template rendering fails
             OutputWriteError: If file writing fails
         """
+        # Resolve every template before touching the filesystem, and build
+        # the render context once for all formats
+        templates = {fmt: self._get_template(fmt) for fmt in formats}
+        context = self._template_context(color_scheme)
+
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write each format
         for fmt in formats:
-            self._write_format(color_scheme, output_dir, fmt)
+            self._write_format(templates[fmt], context, output_dir, fmt)
 
     def _write_format(
         self,
-        color_scheme: ColorScheme,
+        template: Template,
+        context: dict[str, Any],
         output_dir: Path,
         fmt: ColorFormat,
     ) -> None:
         """Write a single format.
 
         Args:
-            color_scheme: ColorScheme to write
+            template: Template for the format
+            context: Template context from _template_context()
             output_dir: Directory to write to
             fmt: Format to write
 
@@ -92,7 +155,7 @@ class OutputManager:
             OutputWriteError: If file writing fails
         """
         # Render template
-        content = self._render_template(color_scheme, fmt)
+        content = self._render(template, context)
 
         # Determine output file path
         file_path = output_dir / f"colors.{fmt.value}"
@@ -121,20 +184,26 @@ class OutputManager:
         Raises:
             TemplateRenderError: If template rendering fails
         """
+        return self._render(
+            self._get_template(fmt), self._template_context(color_scheme)
+        )
+
+    def _get_template(self, fmt: ColorFormat) -> Template:
+        """Load the Jinja2 template for a format.
+
+        Args:
+            fmt: Format to load the template for
+
+        Returns:
+            Compiled template
+
+        Raises:
+            TemplateRenderError: If the template is missing or invalid
+        """
         template_name = f"colors.{fmt.value}.j2"
 
         try:
-            template = self.template_env.get_template(template_name)
-            content = template.render(
-                source_image=str(color_scheme.source_image),
-                backend=color_scheme.backend,
-                generated_at=color_scheme.generated_at.isoformat(),
-                background=color_scheme.background,
-                foreground=color_scheme.foreground,
-                cursor=color_scheme.cursor,
-                colors=color_scheme.colors,
-            )
-            return content
+            return self.template_env.get_template(template_name)
         except TemplateNotFound as e:
             raise TemplateRenderError(
                 template_name=template_name, reason="Template not found"
@@ -142,6 +211,45 @@ class OutputManager:
         except Exception as e:
             raise TemplateRenderError(template_name=template_name, reason=str(e)) from e
 
+    def _template_context(self, color_scheme: ColorScheme) -> dict[str, Any]:
+        """Build the variables shared by every format's template.
+
+        Args:
+            color_scheme: ColorScheme to render
+
+        Returns:
+            Template context
+        """
+        return {
+            "source_image": str(color_scheme.source_image),
+            "backend": color_scheme.backend,
+            "generated_at": color_scheme.generated_at.isoformat(),
+            "background": color_scheme.background,
+            "foreground": color_scheme.foreground,
+            "cursor": color_scheme.cursor,
+            "colors": color_scheme.colors,
+        }
+
+    def _render(self, template: Template, context: dict[str, Any]) -> str:
+        """Render a template.
+
+        Args:
+            template: Template to render
+            context: Template context from _template_context()
+
+        Returns:
+            Rendered template content
+
+        Raises:
+            TemplateRenderError: If template rendering fails
+        """
+        try:
+            return template.render(context)
+        except Exception as e:
+            raise TemplateRenderError(
+                template_name=template.name or "<unknown>", reason=str(e)
+            ) from e
+
     def _convert_to_escape_sequences(self, content: str) -> bytes:
         """Convert template placeholders to actual escape sequences.
 
@@ -154,11 +262,9 @@ class OutputManager:
         Returns:
             Binary content with actual escape sequences
         """
-        # Replace ] with ESC] and \ with ESC\
+        # Both placeholders are substituted in a single pass
         # ESC is \x1b (ASCII 27)
-        content = content.replace("]", "\x1b]")
-        content = content.replace("\\", "\x1b\\")
-        return content.encode("utf-8")
+        return content.translate(_ESCAPE_SEQUENCES).encode("utf-8")
 
     def _write_binary_file(self, file_path: Path, content: bytes) -> None:
         """Write binary content to file.
@@ -189,11 +295,5 @@ class OutputManager:
         Raises:
             OutputWriteError: If writing fails
         """
-        try:
-            file_path.write_text(content, encoding="utf-8")
-        except PermissionError as e:
-            raise OutputWriteError(
-                file_path=str(file_path), reason="Permission denied"
-            ) from e
-        except OSError as e:
-            raise OutputWriteError(file_path=str(file_path), reason=str(e)) from e
+        # Encoding up front skips the TextIOWrapper layer of write_text()
+        self._write_binary_file(file_path, content.encode("utf-8"))
@@ -7,6 +7,11 @@ import pytest
 from color_scheme.config import defaults
 
 
+@pytest.fixture(autouse=True)
+def isolated_home():
+    """Keep the real HOME, which path defaults were computed from at import."""
+
+
 class TestLoggingDefaults:
     """Tests for logging default values."""
 
@@ -1,10 +1,31 @@
 """Pytest configuration and fixtures."""
 
+import color_scheme_settings
 import pytest
+from typer.testing import CliRunner
 
 from color_scheme.config.config import AppConfig
 
 
+@pytest.fixture(scope="session")
+def runner():
+    """Create CLI test runner (stateless, shared by all CLI tests)."""
+    return CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch):
+    """Point HOME at a temporary directory.
+
+    The scheme and template caches default to ~/.cache/color-scheme; this
+    keeps tests from writing there. Settings are reloaded under the new HOME.
+    """
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setattr(color_scheme_settings, "_config", None)
+    return home
+
+
 @pytest.fixture
 def sample_settings_dict():
     """Sample settings dictionary for testing."""
@@ -28,6 +49,7 @@ def sample_settings_dict():
             "custom": {"algorithm": "kmeans", "n_clusters": 16},
         },
         "templates": {"directory": "templates"},
+        "cache": {"enabled": False, "directory": "/tmp/test-cache"},
     }
 
 
@@ -3,7 +3,6 @@
 from pathlib import Path
 
 import pytest
-from typer.testing import CliRunner
 
 from color_scheme.cli.main import app
 
@@ -11,11 +10,6 @@ from color_scheme.cli.main import app
 class TestGenerateDryRun:
     """Integration tests for generate --dry-run."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @pytest.fixture
     def test_image(self):
         """Path to test image."""
@@ -88,11 +82,6 @@ class TestGenerateDryRun:
 class TestShowDryRun:
     """Integration tests for show --dry-run."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @pytest.fixture
     def test_image(self):
         """Path to test image."""
@@ -4,7 +4,6 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from color_scheme.cli.main import app
 from color_scheme.core.types import Color, ColorScheme
@@ -13,11 +12,6 @@ from color_scheme.core.types import Color, ColorScheme
 class TestCLIGenerate:
     """Integration tests for the generate command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @pytest.fixture
     def test_image(self):
         """Path to test image."""
@@ -136,10 +130,6 @@ class TestCLIGenerate:
 class TestGenerateSaturationAppliedOnce:
     """CRIT-04: CLI must not re-apply saturation after the backend applied it."""
 
-    @pytest.fixture
-    def runner(self):
-        return CliRunner()
-
     @pytest.fixture
     def mock_color_scheme(self):
         mock_color = MagicMock(spec=Color)
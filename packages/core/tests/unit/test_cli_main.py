@@ -6,9 +6,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from PIL import Image
-from typer.testing import CliRunner
 
 from color_scheme.cli.main import app
+from color_scheme.config.enums import Backend
 from color_scheme.core.exceptions import (
     BackendNotAvailableError,
     ColorExtractionError,
@@ -17,12 +17,7 @@ from color_scheme.core.exceptions import (
     OutputWriteError,
     TemplateRenderError,
 )
-
-
-@pytest.fixture
-def runner():
-    """Create CLI test runner."""
-    return CliRunner()
+from color_scheme.core.types import Color, ColorScheme
 
 
 @pytest.fixture
@@ -34,23 +29,19 @@ def test_image(tmp_path):
     return img_path
 
 
-def _mock_color():
-    """Create mock Color."""
-    c = MagicMock()
-    c.adjust_saturation = MagicMock(return_value=c)
-    c.hex = "#FF0000"
-    c.rgb = (255, 0, 0)
-    return c
+_RED = Color(hex="#FF0000", rgb=(255, 0, 0))
 
 
-def _mock_scheme():
-    """Create mock ColorScheme."""
-    s = MagicMock()
-    s.background = _mock_color()
-    s.foreground = _mock_color()
-    s.cursor = _mock_color()
-    s.colors = [_mock_color() for _ in range(16)]
-    return s
+def _make_scheme():
+    """Create a minimal ColorScheme for the CLI to display."""
+    return ColorScheme(
+        background=_RED,
+        foreground=_RED,
+        cursor=_RED,
+        colors=[_RED] * 16,
+        source_image=Path("/tmp/test.png"),
+        backend="custom",
+    )
 
 
 class TestVersionCommand:
@@ -80,6 +71,16 @@ class TestGenerateErrors:
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower()
 
+    def test_symlink_loop(self, runner, tmp_path):
+        """Test a looping symlink is reported as not found."""
+        loop = tmp_path / "loop.png"
+        loop.symlink_to(loop)
+
+        result = runner.invoke(app, ["generate", str(loop), "-o", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "image file not found" in result.stdout.lower()
+
     def test_path_is_directory(self, runner, tmp_path):
         """Test error when path is directory."""
         result = runner.invoke(app, ["generate", str(tmp_path), "-o", str(tmp_path)])
@@ -91,7 +92,7 @@ class TestGenerateErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = InvalidImageError(str(test_image), "corrupt")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(
@@ -118,7 +119,7 @@ class TestGenerateErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = ColorExtractionError("pywal", "failed")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(
@@ -132,10 +133,8 @@ class TestGenerateErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock_factory:
             with patch("color_scheme.cli.main.OutputManager") as mock_output:
                 gen = MagicMock()
-                gen.generate.return_value = _mock_scheme()
-                mock_factory.return_value.auto_detect.return_value = MagicMock(
-                    value="custom"
-                )
+                gen.generate.return_value = _make_scheme()
+                mock_factory.return_value.auto_detect.return_value = Backend.CUSTOM
                 mock_factory.return_value.create.return_value = gen
                 mock_output.return_value.write_outputs.side_effect = (
                     TemplateRenderError("colors.css.j2", "syntax error")
@@ -152,10 +151,8 @@ class TestGenerateErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock_factory:
             with patch("color_scheme.cli.main.OutputManager") as mock_output:
                 gen = MagicMock()
-                gen.generate.return_value = _mock_scheme()
-                mock_factory.return_value.auto_detect.return_value = MagicMock(
-                    value="custom"
-                )
+                gen.generate.return_value = _make_scheme()
+                mock_factory.return_value.auto_detect.return_value = Backend.CUSTOM
                 mock_factory.return_value.create.return_value = gen
                 mock_output.return_value.write_outputs.side_effect = OutputWriteError(
                     Path("/readonly"), "permission denied"
@@ -172,7 +169,7 @@ class TestGenerateErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = ColorSchemeError("something broke")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(
@@ -186,7 +183,7 @@ class TestGenerateErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = RuntimeError("crash")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(
@@ -227,6 +224,32 @@ class TestShowErrors:
         assert result.exit_code == 1
         assert "not found" in result.stdout.lower()
 
+    def test_symlink_loop(self, runner, tmp_path):
+        """Test a looping symlink is reported as not found."""
+        loop = tmp_path / "loop.png"
+        loop.symlink_to(loop)
+
+        result = runner.invoke(app, ["show", str(loop)])
+
+        assert result.exit_code == 1
+        assert "image file not found" in result.stdout.lower()
+
+    def test_permission_denied(self, runner, test_image):
+        """Test an inaccessible path gets its own error."""
+        original_stat = Path.stat
+
+        def stat(path, **kwargs):
+            if path == test_image:
+                raise PermissionError(13, "Permission denied")
+            return original_stat(path, **kwargs)
+
+        with patch.object(Path, "stat", stat):
+            result = runner.invoke(app, ["show", str(test_image)])
+
+        assert result.exit_code == 1
+        assert "cannot access image file" in result.stdout.lower()
+        assert "permission denied" in result.stdout.lower()
+
     def test_path_is_directory(self, runner, tmp_path):
         """Test error when path is directory."""
         result = runner.invoke(app, ["show", str(tmp_path)])
@@ -238,7 +261,7 @@ class TestShowErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = InvalidImageError(str(test_image), "corrupt")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(app, ["show", str(test_image)])
@@ -261,7 +284,7 @@ class TestShowErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = ColorExtractionError("pywal", "failed")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(app, ["show", str(test_image)])
@@ -273,7 +296,7 @@ class TestShowErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = ColorSchemeError("broke")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(app, ["show", str(test_image)])
@@ -285,7 +308,7 @@ class TestShowErrors:
         with patch("color_scheme.cli.main.BackendFactory") as mock:
             gen = MagicMock()
             gen.generate.side_effect = RuntimeError("crash")
-            mock.return_value.auto_detect.return_value = MagicMock(value="custom")
+            mock.return_value.auto_detect.return_value = Backend.CUSTOM
             mock.return_value.create.return_value = gen
 
             result = runner.invoke(app, ["show", str(test_image)])
@@ -3,9 +3,15 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
+from PIL import Image
 
-from color_scheme.backends.custom import CustomGenerator
+from color_scheme.backends.custom import (
+    CustomGenerator,
+    _color_histogram,
+    _sample_pixels,
+)
 from color_scheme.core.exceptions import ColorExtractionError, InvalidImageError
 from color_scheme.core.types import GeneratorConfig
 
@@ -64,6 +70,26 @@ class TestCustomGenerator:
 
         assert "not a file" in str(exc_info.value).lower()
 
+    def test_generate_symlink_loop(self, generator, config, tmp_path):
+        """Test a symlink loop is reported as an invalid image."""
+        loop = tmp_path / "loop.png"
+        loop.symlink_to(loop)
+
+        with pytest.raises(InvalidImageError) as exc_info:
+            generator.generate(loop, config)
+
+        assert "cannot access" in str(exc_info.value).lower()
+
+    def test_generate_permission_denied(self, generator, test_image, config):
+        """Test an unreadable path is reported as an invalid image."""
+        with patch.object(
+            Path, "stat", side_effect=PermissionError(13, "Permission denied")
+        ):
+            with pytest.raises(InvalidImageError) as exc_info:
+                generator.generate(test_image, config)
+
+        assert "permission denied" in str(exc_info.value).lower()
+
     def test_generate_with_saturation_adjustment(self, generator, test_image):
         """Test generation with saturation adjustment."""
         config = GeneratorConfig(saturation_adjustment=1.5)
@@ -72,6 +98,17 @@ class TestCustomGenerator:
         assert scheme.backend == "custom"
         assert len(scheme.colors) == 16
 
+    def test_saturation_matches_per_color_adjustment(
+        self, generator, config, test_image
+    ):
+        """Test the batched adjustment equals adjusting each color."""
+        plain = generator.generate(test_image, config)
+        adjusted = generator.generate(
+            test_image, GeneratorConfig(saturation_adjustment=1.5)
+        )
+
+        assert adjusted.colors == [c.adjust_saturation(1.5) for c in plain.colors]
+
     def test_generate_with_few_clusters(self, test_image):
         """Test generation when extracting fewer than 16 colors."""
         # Create generator with only 8 clusters to trigger duplication logic
@@ -138,3 +175,88 @@ class TestCustomGenerator:
 
             assert "custom" in str(exc_info.value).lower()
             assert "test error" in str(exc_info.value).lower()
+
+    def test_generate_many(self, generator, test_image, config):
+        """Test generating schemes for several images in parallel."""
+        single = generator.generate(test_image, config)
+
+        schemes = generator.generate_many([test_image] * 3, config, max_workers=3)
+
+        assert len(schemes) == 3
+        assert all(s.colors == single.colors for s in schemes)
+
+    def test_generate_many_propagates_errors(self, generator, test_image, config):
+        """Test an invalid image fails the whole batch."""
+        with pytest.raises(InvalidImageError):
+            generator.generate_many(
+                [test_image, Path("/nonexistent/image.png")], config
+            )
+
+    def test_sample_pixels_downsamples_large_image(self):
+        """Test large images are sampled at reduced size, leaving the input."""
+        img = Image.new("RGB", (1000, 250), color="red")
+
+        pixels = _sample_pixels(img)
+
+        assert pixels.shape == (200 * 50, 3)
+        assert img.size == (1000, 250)
+
+    def test_color_histogram_bins_and_weights(self):
+        """Test pixels are grouped into bins with their mean color and count."""
+        pixels = np.array(
+            [[255, 0, 0], [250, 2, 4], [0, 0, 255], [10, 10, 10]], dtype=np.uint8
+        )
+
+        bins, weights = _color_histogram(pixels)
+
+        # Bins come out in index order: blue, dark gray, red
+        assert weights.tolist() == [1, 1, 2]
+        assert bins.tolist() == [[0, 0, 255], [10, 10, 10], [252.5, 1, 2]]
+
+    def test_extract_few_distinct_colors_skips_kmeans(self, generator):
+        """Test images with fewer colors than clusters skip sklearn entirely."""
+        img = Image.new("RGB", (100, 100), color="red")
+        img.paste((0, 0, 255), (50, 0, 100, 100))
+
+        # A None entry makes importing sklearn.cluster fail
+        with patch.dict("sys.modules", {"sklearn.cluster": None}):
+            colors = generator._extract_colors_kmeans(img)
+
+        assert len(colors) == generator.n_clusters
+        assert {c.hex for c in colors} == {"#0000FF", "#FF0000"}
+
+    def test_two_color_image_keeps_foreground_distinct(
+        self, generator, config, tmp_path
+    ):
+        """Test a two-color image does not use the background as foreground."""
+        image = tmp_path / "two_colors.png"
+        img = Image.new("RGB", (100, 100), color=(10, 10, 60))
+        img.paste((200, 30, 30), (50, 0, 100, 100))
+        img.save(image)
+
+        scheme = generator.generate(image, config)
+
+        assert scheme.background.hex == "#0A0A3C"
+        assert scheme.foreground.hex == "#C81E1E"
+        assert scheme.foreground != scheme.background
+
+    def test_extracted_colors_sorted_by_brightness(self, generator, test_image):
+        """Test extracted colors come out darkest first."""
+        with Image.open(test_image) as img:
+            colors = generator._extract_colors_kmeans(img.convert("RGB"))
+
+        sums = [sum(c.rgb) for c in colors]
+        assert sums == sorted(sums)
+
+    def test_generate_jpeg_uses_draft_mode(self, generator, config, tmp_path):
+        """Test large JPEGs are decoded at reduced scale."""
+        jpeg = tmp_path / "large.jpg"
+        Image.new("RGB", (1600, 1200), color=(200, 40, 40)).save(jpeg)
+
+        with patch.object(
+            generator, "_extract_colors_kmeans", wraps=generator._extract_colors_kmeans
+        ) as extract:
+            scheme = generator.generate(jpeg, config)
+
+        assert max(extract.call_args.args[0].size) < 1600
+        assert len(scheme.colors) == 16
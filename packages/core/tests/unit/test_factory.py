@@ -105,3 +105,16 @@ class TestBackendFactory:
         # Even if all backends throw exceptions during check, we fall back to custom
         backend = factory.auto_detect()
         assert backend == Backend.CUSTOM
+
+    @patch("shutil.which")
+    def test_create_reuses_detected_generator(self, mock_which, factory):
+        """Test create() reuses the generator probed by auto_detect()."""
+        mock_which.return_value = "/usr/bin/wallust"
+
+        backend = factory.auto_detect()
+        first = factory.create(backend)
+        second = factory.create(backend)
+
+        assert backend == Backend.WALLUST
+        assert first is second
+        mock_which.assert_called_once_with("wallust")
@@ -1,5 +1,6 @@
 """Tests for OutputManager."""
 
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -42,6 +43,92 @@ class TestOutputManagerInit:
         assert manager.template_env is not None
         assert manager.template_env.loader is not None
 
+    def test_no_bytecode_cache_when_disabled(self, app_config):
+        """Test compiled templates are not cached when caching is off."""
+        manager = OutputManager(app_config)
+
+        assert manager.template_env.bytecode_cache is None
+
+    def test_bytecode_cache_in_cache_directory(self, sample_settings_dict, tmp_path):
+        """Test compiled templates are cached under the cache directory."""
+        from color_scheme.config.config import AppConfig
+
+        sample_settings_dict["cache"] = {
+            "enabled": True,
+            "directory": str(tmp_path / "cache"),
+        }
+        manager = OutputManager(AppConfig(**sample_settings_dict))
+
+        manager.template_env.get_template("colors.json.j2")
+
+        assert list((tmp_path / "cache" / "jinja").glob("*.cache"))
+
+    def test_bytecode_cache_defaults_under_home(self, isolated_home):
+        """Test the default template cache lives under the current home."""
+        from color_scheme.config.config import AppConfig
+
+        manager = OutputManager(AppConfig())
+
+        assert (isolated_home / ".cache" / "color-scheme" / "jinja").is_dir()
+        assert manager.template_env.bytecode_cache is not None
+
+    def test_bytecode_cache_unavailable(self, sample_settings_dict, tmp_path, caplog):
+        """Test an uncreatable cache directory warns and compiles in memory."""
+        from color_scheme.config.config import AppConfig
+
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory")
+        sample_settings_dict["cache"] = {"enabled": True, "directory": str(blocker)}
+
+        with caplog.at_level("WARNING", logger="color_scheme.output.manager"):
+            manager = OutputManager(AppConfig(**sample_settings_dict))
+
+        assert manager.template_env.bytecode_cache is None
+        assert "template cache disabled" in caplog.text.lower()
+
+    @pytest.fixture
+    def cache_settings(self, sample_settings_dict, tmp_path):
+        """Create settings with the cache enabled in a temporary directory."""
+        from color_scheme.config.config import AppConfig
+
+        sample_settings_dict["cache"] = {
+            "enabled": True,
+            "directory": str(tmp_path / "cache"),
+        }
+        return AppConfig(**sample_settings_dict)
+
+    def test_bytecode_cache_directory_is_private(self, cache_settings, tmp_path):
+        """Test the template cache directory is created with mode 0700."""
+        OutputManager(cache_settings)
+
+        mode = (tmp_path / "cache" / "jinja").stat().st_mode
+        assert mode & 0o777 == 0o700
+
+    def test_bytecode_cache_rejects_shared_directory(
+        self, cache_settings, tmp_path, caplog
+    ):
+        """Test a group/world-writable cache directory is not used."""
+        jinja_dir = tmp_path / "cache" / "jinja"
+        jinja_dir.mkdir(parents=True)
+        jinja_dir.chmod(0o777)
+
+        with caplog.at_level("WARNING", logger="color_scheme.output.manager"):
+            manager = OutputManager(cache_settings)
+
+        assert manager.template_env.bytecode_cache is None
+        assert "not private" in caplog.text
+
+    def test_bytecode_cache_rejects_foreign_owner(self, cache_settings, caplog):
+        """Test a cache directory owned by another user is not used."""
+        from unittest.mock import patch
+
+        with patch("os.getuid", return_value=os.getuid() + 1):
+            with caplog.at_level("WARNING", logger="color_scheme.output.manager"):
+                manager = OutputManager(cache_settings)
+
+        assert manager.template_env.bytecode_cache is None
+        assert "not private" in caplog.text
+
 
 class TestWriteOutputs:
     """Test OutputManager.write_outputs method."""
@@ -194,6 +281,33 @@ class TestErrorHandling:
 
         assert "nonexistent" in exc_info.value.template_name
 
+    def test_missing_template_fails_before_writing(self, color_scheme, tmp_path):
+        """Test a missing template is reported before any file is written."""
+        from color_scheme.config.config import (
+            AppConfig,
+            CacheSettings,
+            TemplateSettings,
+        )
+
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "colors.json.j2").write_text('{"backend": "{{ backend }}"}')
+        manager = OutputManager(
+            AppConfig(
+                templates=TemplateSettings(directory=template_dir),
+                cache=CacheSettings(enabled=False),
+            )
+        )
+        output_dir = tmp_path / "output"
+
+        with pytest.raises(TemplateRenderError) as exc_info:
+            manager.write_outputs(
+                color_scheme, output_dir, [ColorFormat.JSON, ColorFormat.CSS]
+            )
+
+        assert exc_info.value.template_name == "colors.css.j2"
+        assert not output_dir.exists()
+
     def test_permission_denied_write(self, manager, color_scheme, tmp_path):
         """Test error when permission denied during write."""
         from pathlib import Path as PathlibPath
@@ -204,9 +318,9 @@ class TestErrorHandling:
 
         formats = [ColorFormat.JSON]
 
-        # Mock write_text to raise PermissionError
+        # Mock write_bytes (text is encoded and written as bytes)
         with patch.object(
-            PathlibPath, "write_text", side_effect=PermissionError("Permission denied")
+            PathlibPath, "write_bytes", side_effect=PermissionError("Permission denied")
         ):
             with pytest.raises(OutputWriteError) as exc_info:
                 manager.write_outputs(color_scheme, output_dir, formats)
@@ -234,13 +348,36 @@ class TestErrorHandling:
             assert "colors.sequences" in exc_info.value.file_path
             assert "Permission denied" in exc_info.value.reason
 
+    def test_write_error_with_multiple_formats(self, manager, color_scheme, tmp_path):
+        """Test writing stops at the first format that fails."""
+        from pathlib import Path as PathlibPath
+        from unittest.mock import patch
+
+        output_dir = tmp_path / "output"
+        formats = [ColorFormat.JSON, ColorFormat.CSS, ColorFormat.SEQUENCES]
+
+        original_write_bytes = PathlibPath.write_bytes
+
+        def write_bytes(path, data):
+            if path.name == "colors.css":
+                raise PermissionError("Permission denied")
+            return original_write_bytes(path, data)
+
+        with patch.object(PathlibPath, "write_bytes", write_bytes):
+            with pytest.raises(OutputWriteError) as exc_info:
+                manager.write_outputs(color_scheme, output_dir, formats)
+
+        assert "colors.css" in exc_info.value.file_path
+        assert (output_dir / "colors.json").exists()
+        assert not (output_dir / "colors.sequences").exists()
+
     def test_oserror_write_file(self, manager, color_scheme, tmp_path):
         """Test OSError handling in _write_file."""
         from unittest.mock import Mock
 
         # Mock file path that raises OSError
         mock_path = Mock(spec=Path)
-        mock_path.write_text.side_effect = OSError("Disk full")
+        mock_path.write_bytes.side_effect = OSError("Disk full")
         # Configure the return value for __str__
         type(mock_path).__str__ = Mock(return_value="/fake/path/colors.json")
 
@@ -289,3 +426,11 @@ class TestErrorHandling:
 
         assert "colors.json.j2" in exc_info.value.template_name
         assert "Template error" in exc_info.value.reason
+
+    def test_convert_to_escape_sequences(self, manager):
+        """Test both placeholders are replaced with ESC-prefixed sequences."""
+        content = "]4;0;#000000\\]11;#FFFFFF\\"
+
+        assert manager._convert_to_escape_sequences(content) == (
+            b"\x1b]4;0;#000000\x1b\\\x1b]11;#FFFFFF\x1b\\"
+        )
@@ -13,6 +13,33 @@ from color_scheme.core.exceptions import (
 )
 from color_scheme.core.types import GeneratorConfig
 
+# Pywal cache file contents shared by the generation tests
+_WAL_COLORS_JSON = """{
+    "special": {
+        "background": "#1a1a1a",
+        "foreground": "#ffffff",
+        "cursor": "#ff0000"
+    },
+    "colors": {
+        "color0": "#000000",
+        "color1": "#111111",
+        "color2": "#222222",
+        "color3": "#333333",
+        "color4": "#444444",
+        "color5": "#555555",
+        "color6": "#666666",
+        "color7": "#777777",
+        "color8": "#888888",
+        "color9": "#999999",
+        "color10": "#aaaaaa",
+        "color11": "#bbbbbb",
+        "color12": "#cccccc",
+        "color13": "#dddddd",
+        "color14": "#eeeeee",
+        "color15": "#ffffff"
+    }
+}"""
+
 
 class TestPywalGenerator:
     """Tests for PywalGenerator."""
@@ -32,6 +59,13 @@ class TestPywalGenerator:
         """Create GeneratorConfig."""
         return GeneratorConfig()
 
+    @pytest.fixture
+    def wal_cache_file(self, tmp_path):
+        """Write a pywal colors.json cache file."""
+        cache_file = tmp_path / "colors.json"
+        cache_file.write_text(_WAL_COLORS_JSON)
+        return cache_file
+
     def test_backend_name(self, generator):
         """Test backend name."""
         assert generator.backend_name == "pywal"
@@ -61,7 +95,7 @@ class TestPywalGenerator:
     @patch("subprocess.run")
     @patch("shutil.which")
     def test_generate_success(
-        self, mock_which, mock_run, generator, test_image, config, tmp_path
+        self, mock_which, mock_run, generator, test_image, config, wal_cache_file
     ):
         """Test successful color generation."""
         mock_which.return_value = "/usr/bin/wal"
@@ -75,35 +109,7 @@ class TestPywalGenerator:
         result.stderr = ""
         mock_run.return_value = result
 
-        # Mock pywal cache file
-        cache_file = tmp_path / "colors.json"
-        cache_file.write_text("""{
-            "special": {
-                "background": "#1a1a1a",
-                "foreground": "#ffffff",
-                "cursor": "#ff0000"
-            },
-            "colors": {
-                "color0": "#000000",
-                "color1": "#111111",
-                "color2": "#222222",
-                "color3": "#333333",
-                "color4": "#444444",
-                "color5": "#555555",
-                "color6": "#666666",
-                "color7": "#777777",
-                "color8": "#888888",
-                "color9": "#999999",
-                "color10": "#aaaaaa",
-                "color11": "#bbbbbb",
-                "color12": "#cccccc",
-                "color13": "#dddddd",
-                "color14": "#eeeeee",
-                "color15": "#ffffff"
-            }
-        }""")
-
-        with patch.object(generator, "_get_cache_file", return_value=cache_file):
+        with patch.object(generator, "_get_cache_file", return_value=wal_cache_file):
             scheme = generator.generate(test_image, config)
 
         assert scheme.backend == "pywal"
@@ -220,7 +226,7 @@ class TestPywalGenerator:
     @patch("subprocess.run")
     @patch("shutil.which")
     def test_generate_with_saturation(
-        self, mock_which, mock_run, generator, test_image, tmp_path
+        self, mock_which, mock_run, generator, test_image, wal_cache_file
     ):
         """Test generation with saturation adjustment."""
         from unittest.mock import MagicMock
@@ -234,38 +240,101 @@ class TestPywalGenerator:
         result.stderr = ""
         mock_run.return_value = result
 
-        # Mock pywal cache file
-        cache_file = tmp_path / "colors.json"
-        cache_file.write_text("""{
-            "special": {
-                "background": "#1a1a1a",
-                "foreground": "#ffffff",
-                "cursor": "#ff0000"
-            },
-            "colors": {
-                "color0": "#000000",
-                "color1": "#111111",
-                "color2": "#222222",
-                "color3": "#333333",
-                "color4": "#444444",
-                "color5": "#555555",
-                "color6": "#666666",
-                "color7": "#777777",
-                "color8": "#888888",
-                "color9": "#999999",
-                "color10": "#aaaaaa",
-                "color11": "#bbbbbb",
-                "color12": "#cccccc",
-                "color13": "#dddddd",
-                "color14": "#eeeeee",
-                "color15": "#ffffff"
-            }
-        }""")
-
         config = GeneratorConfig(saturation_adjustment=1.5)
 
-        with patch.object(generator, "_get_cache_file", return_value=cache_file):
+        with patch.object(generator, "_get_cache_file", return_value=wal_cache_file):
             scheme = generator.generate(test_image, config)
 
         assert scheme.backend == "pywal"
         assert len(scheme.colors) == 16
+
+    def test_generate_many_runs_sequentially(self, generator, test_image, config):
+        """Test pywal batches run one image at a time, in order."""
+        images = [test_image, Path("other.png")]
+
+        with patch.object(generator, "generate", side_effect=["a", "b"]) as mock_gen:
+            results = generator.generate_many(images, config)
+
+        assert results == ["a", "b"]
+        assert [c.args[0] for c in mock_gen.call_args_list] == images
+
+    @patch("subprocess.run")
+    @patch("shutil.which")
+    def test_stdout_discarded_unless_debug(
+        self, mock_which, mock_run, generator, test_image, config, caplog
+    ):
+        """Test pywal stdout is only captured when debug logging is on."""
+        import subprocess
+
+        mock_which.return_value = "/usr/bin/wal"
+        mock_run.side_effect = subprocess.TimeoutExpired("wal", 30)
+
+        with caplog.at_level("INFO", logger="color_scheme.backends.pywal"):
+            with pytest.raises(ColorExtractionError):
+                generator.generate(test_image, config)
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.DEVNULL
+
+        with caplog.at_level("DEBUG", logger="color_scheme.backends.pywal"):
+            with pytest.raises(ColorExtractionError):
+                generator.generate(test_image, config)
+        assert mock_run.call_args.kwargs["stdout"] is subprocess.PIPE
+        assert mock_run.call_args.kwargs["stderr"] is subprocess.PIPE
+
+    @patch("shutil.which")
+    def test_backend_settings_from_pywal_section(
+        self, mock_which, sample_settings_dict, test_image
+    ):
+        """Test pywal settings apply even when another backend is the default."""
+        from color_scheme.config.config import AppConfig
+
+        mock_which.return_value = "/usr/bin/wal"
+        sample_settings_dict["backends"]["pywal"]["backend_algorithm"] = "colorz"
+        generator = PywalGenerator(AppConfig(**sample_settings_dict))
+
+        with patch.object(generator, "_run_pywal") as mock_run:
+            generator.generate(test_image, GeneratorConfig())
+            generator.generate(
+                test_image,
+                GeneratorConfig(backend_options={"backend_algorithm": "haishoku"}),
+            )
+
+        assert mock_run.call_args_list[0].args[1]["backend_algorithm"] == "colorz"
+        assert mock_run.call_args_list[1].args[1]["backend_algorithm"] == "haishoku"
+
+    @pytest.mark.parametrize(
+        "hex_color,expected",
+        [
+            ("#1A2B3C", (26, 43, 60)),
+            ("#ffffff", (255, 255, 255)),
+            ("1a2b3c", (26, 43, 60)),
+        ],
+    )
+    def test_hex_to_rgb(self, generator, hex_color, expected):
+        """Test hex parsing with and without the leading '#'."""
+        assert generator._hex_to_rgb(hex_color) == expected
+
+    def test_read_cache_file_too_large(self, generator, tmp_path):
+        """Test oversized cache files are rejected without parsing them."""
+        from color_scheme.backends import pywal
+
+        cache_file = tmp_path / "colors.json"
+        cache_file.write_bytes(b" " * (pywal._MAX_CACHE_FILE_SIZE + 1))
+
+        with pytest.raises(ColorExtractionError) as exc_info:
+            generator._read_cache_file(cache_file)
+
+        assert "too large" in str(exc_info.value)
+
+    def test_make_color_matches_validated_color(self, generator):
+        """Test trusted color construction matches the validated model."""
+        from color_scheme.core.types import Color
+
+        assert generator._make_color("#1A2B3C") == Color(
+            hex="#1A2B3C", rgb=(26, 43, 60)
+        )
+
+    @pytest.mark.parametrize("hex_color", ["#12345", "#GGGGGG", "#1234567"])
+    def test_make_color_rejects_invalid_hex(self, generator, hex_color):
+        """Test malformed backend colors are still rejected."""
+        with pytest.raises(ValueError):
+            generator._make_color(hex_color)
@@ -0,0 +1,243 @@
+"""Tests for the backend scheme cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from color_scheme.backends.pywal import PywalGenerator
+from color_scheme.backends.wallust import WallustGenerator
+from color_scheme.cache import SchemeCache
+from color_scheme.config.config import AppConfig
+from color_scheme.core.types import Color, ColorScheme, GeneratorConfig
+
+
+def _make_scheme(image_path: Path, backend: str = "pywal") -> ColorScheme:
+    """Build a simple grayscale scheme."""
+    colors = [
+        Color(hex=f"#{i * 17:02X}{i * 17:02X}{i * 17:02X}", rgb=(i * 17,) * 3)
+        for i in range(16)
+    ]
+    return ColorScheme(
+        background=colors[0],
+        foreground=colors[15],
+        cursor=colors[1],
+        colors=colors,
+        source_image=image_path,
+        backend=backend,
+    )
+
+
+class TestSchemeCache:
+    """Tests for SchemeCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create SchemeCache in a temporary directory."""
+        return SchemeCache(tmp_path / "cache")
+
+    @pytest.fixture
+    def image(self, tmp_path):
+        """Create a fake image file."""
+        path = tmp_path / "image.png"
+        path.write_bytes(b"image-bytes")
+        return path
+
+    def test_miss_returns_none(self, cache, image):
+        """Test lookup of an unknown key."""
+        key = cache.key(image, "pywal", {"backend_algorithm": "wal"})
+        assert cache.get(key, image, "pywal") is None
+
+    def test_put_then_get(self, cache, image):
+        """Test a stored scheme is returned on lookup."""
+        key = cache.key(image, "pywal", {"backend_algorithm": "wal"})
+        cache.put(key, _make_scheme(image))
+
+        cached = cache.get(key, image, "pywal")
+
+        assert cached is not None
+        assert cached.background.hex == "#000000"
+        assert cached.colors[15].hex == "#FFFFFF"
+        assert cached.source_image == image
+        assert cached.backend == "pywal"
+
+    def test_key_depends_on_settings(self, cache, image):
+        """Test different backend settings produce different keys."""
+        key_wal = cache.key(image, "pywal", {"backend_algorithm": "wal"})
+        key_colorz = cache.key(image, "pywal", {"backend_algorithm": "colorz"})
+        assert key_wal != key_colorz
+
+    def test_key_depends_on_backend(self, cache, image):
+        """Test different backends produce different keys."""
+        assert cache.key(image, "pywal", {}) != cache.key(image, "wallust", {})
+
+    def test_key_depends_on_tool_executable(self, cache, image, tmp_path):
+        """Test reinstalling the backend tool invalidates the key."""
+        tool = tmp_path / "wal"
+        tool.write_text("#!/bin/sh\n")
+        before = cache.key(image, "pywal", {}, str(tool))
+
+        tool.write_text("#!/bin/sh\n# upgraded\n")
+
+        assert cache.key(image, "pywal", {}, str(tool)) != before
+        assert cache.key(image, "pywal", {}, str(tool)) != cache.key(image, "pywal", {})
+
+    def test_key_depends_on_cache_version(self, cache, image):
+        """Test bumping the cache version invalidates every key."""
+        before = cache.key(image, "pywal", {})
+        with patch("color_scheme.cache._CACHE_VERSION", 2):
+            assert cache.key(image, "pywal", {}) != before
+
+    def test_key_follows_content_not_path(self, cache, image, tmp_path):
+        """Test identical images at different paths share a key."""
+        copy = tmp_path / "copy.png"
+        copy.write_bytes(image.read_bytes())
+        assert cache.key(image, "pywal", {}) == cache.key(copy, "pywal", {})
+
+    def test_key_changes_with_content(self, cache, image):
+        """Test editing the image invalidates the key."""
+        before = cache.key(image, "pywal", {})
+        image.write_bytes(b"other-image-bytes")
+        os.utime(image, ns=(0, 0))
+        assert cache.key(image, "pywal", {}) != before
+
+    def test_unchanged_image_is_not_rehashed(self, cache, image):
+        """Test size+mtime matches reuse the stored digest."""
+        cache.key(image, "pywal", {})
+
+        with patch("color_scheme.cache._hash_file") as mock_hash:
+            cache.key(image, "pywal", {})
+
+        mock_hash.assert_not_called()
+
+    def test_index_persists_across_instances(self, tmp_path, image):
+        """Test digests are reused by a fresh cache instance."""
+        SchemeCache(tmp_path / "cache").key(image, "pywal", {})
+
+        fresh = SchemeCache(tmp_path / "cache")
+        with patch("color_scheme.cache._hash_file") as mock_hash:
+            fresh.key(image, "pywal", {})
+
+        mock_hash.assert_not_called()
+
+    def test_corrupt_entry_is_a_miss(self, cache, image):
+        """Test unreadable entries are ignored."""
+        key = cache.key(image, "pywal", {})
+        (cache.cache_dir / f"{key}.json").write_text("not valid json{")
+        assert cache.get(key, image, "pywal") is None
+
+    def test_corrupt_index_is_ignored(self, cache, image):
+        """Test a corrupt index does not break key computation."""
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "index.json").write_text("not valid json{")
+        assert cache.key(image, "pywal", {})
+
+    def test_writes_leave_no_temporary_files(self, cache, image):
+        """Test atomic writes clean up after themselves."""
+        key = cache.key(image, "pywal", {})
+        cache.put(key, _make_scheme(image))
+
+        assert sorted(p.name for p in cache.cache_dir.iterdir()) == sorted(
+            ["index.json", f"{key}.json"]
+        )
+
+    @patch("color_scheme.cache._MAX_INDEX_ENTRIES", 2)
+    def test_index_is_pruned(self, cache, tmp_path):
+        """Test deleted images and then the oldest entries are dropped."""
+        images = []
+        for name in ["a", "b", "c", "d"]:
+            path = tmp_path / f"{name}.png"
+            path.write_bytes(name.encode())
+            images.append(path)
+
+        cache.key(images[0], "pywal", {})
+        cache.key(images[1], "pywal", {})
+        images[0].unlink()
+        cache.key(images[2], "pywal", {})
+        assert list(cache._load_index()) == [str(images[1]), str(images[2])]
+
+        cache.key(images[3], "pywal", {})
+        assert list(cache._load_index()) == [str(images[2]), str(images[3])]
+
+    def test_default_directory_follows_home(self, isolated_home):
+        """Test the default cache lives under the current home directory."""
+        cache = SchemeCache(AppConfig().cache.directory)
+        assert cache.cache_dir == isolated_home / ".cache" / "color-scheme"
+
+
+class TestBackendCaching:
+    """Tests for scheme caching in external backends."""
+
+    @pytest.fixture
+    def settings(self, sample_settings_dict, tmp_path):
+        """Create settings with the cache enabled in a temporary directory."""
+        sample_settings_dict["cache"] = {
+            "enabled": True,
+            "directory": str(tmp_path / "cache"),
+        }
+        return AppConfig(**sample_settings_dict)
+
+    @pytest.fixture
+    def image(self, tmp_path):
+        """Create a fake image file."""
+        path = tmp_path / "image.png"
+        path.write_bytes(b"image-bytes")
+        return path
+
+    def test_cache_disabled(self, app_config):
+        """Test no cache is created when disabled."""
+        assert PywalGenerator(app_config).scheme_cache is None
+
+    @patch("shutil.which")
+    def test_second_run_skips_subprocess(self, mock_which, settings, image):
+        """Test a repeated run is served from the cache."""
+        mock_which.return_value = "/usr/bin/wal"
+        generator = PywalGenerator(settings)
+
+        with patch.object(
+            generator, "_run_pywal", return_value=_make_scheme(image)
+        ) as mock_run:
+            first = generator.generate(image, GeneratorConfig())
+            second = generator.generate(image, GeneratorConfig())
+
+        mock_run.assert_called_once()
+        assert second.colors == first.colors
+
+    @patch("subprocess.run")
+    @patch("shutil.which")
+    def test_wallust_second_run_skips_subprocess(
+        self, mock_which, mock_run, settings, image
+    ):
+        """Test wallust is not re-run for an unchanged image."""
+        mock_which.return_value = "/usr/bin/wallust"
+        generator = WallustGenerator(settings)
+        scheme = _make_scheme(image, backend="wallust")
+
+        with patch.object(generator, "_run_wallust", return_value=scheme):
+            generator.generate(image, GeneratorConfig())
+
+        cached = generator.generate(image, GeneratorConfig())
+
+        mock_run.assert_not_called()
+        assert cached.backend == "wallust"
+        assert cached.colors == scheme.colors
+
+    @patch("shutil.which")
+    def test_saturation_applied_to_cached_scheme(self, mock_which, settings, image):
+        """Test saturation is applied on top of a cached result."""
+        mock_which.return_value = "/usr/bin/wal"
+        generator = PywalGenerator(settings)
+        scheme = _make_scheme(image)
+        scheme.cursor = Color(hex="#CC3333", rgb=(204, 51, 51))
+
+        with patch.object(generator, "_run_pywal", return_value=scheme):
+            generator.generate(image, GeneratorConfig())
+
+        with patch.object(generator, "_run_pywal", side_effect=MagicMock()) as run:
+            adjusted = generator.generate(
+                image, GeneratorConfig(saturation_adjustment=0.5)
+            )
+
+        run.assert_not_called()
+        assert adjusted.cursor.hex != "#CC3333"
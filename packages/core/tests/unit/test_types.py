@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from color_scheme.config.enums import Backend
+from color_scheme.config.enums import Backend, ColorFormat
 from color_scheme.core.types import Color, ColorScheme, GeneratorConfig
 
 
@@ -34,6 +34,12 @@ class TestColor:
         unchanged = color.adjust_saturation(1.0)
         assert unchanged.hex == color.hex
 
+    def test_adjust_saturation_identity(self):
+        """Test a factor of 1.0 returns the color itself."""
+        color = Color(hex="#FF5733", rgb=(255, 87, 51), hsl=(11.0, 1.0, 0.6))
+        assert color.adjust_saturation(1.0) is color
+        assert Color.adjust_saturation_many([color], 1.0)[0] is color
+
     def test_rgb_validation_negative(self):
         """Test RGB validation rejects negative values."""
         with pytest.raises(ValueError, match="RGB values must be in range 0-255"):
@@ -111,6 +117,30 @@ class TestColor:
             Color(hex="#FF5733", rgb=(300, -1, 400))
 
 
+class TestAdjustSaturationMany:
+    """Tests for batched saturation adjustment."""
+
+    COLORS = [
+        Color(hex="#FF5733", rgb=(255, 87, 51)),
+        Color(hex="#D7523B", rgb=(215, 82, 59), hsl=(8.8, 0.66, 0.54)),
+        Color(hex="#1A1A1A", rgb=(26, 26, 26)),
+        Color(hex="#000000", rgb=(0, 0, 0)),
+        Color(hex="#FFFFFF", rgb=(255, 255, 255)),
+        Color(hex="#123456", rgb=(18, 52, 86)),
+        Color(hex="#4AF19C", rgb=(74, 241, 156)),
+    ]
+
+    @pytest.mark.parametrize("factor", [0.0, 0.3, 0.5, 1.0, 1.5, 2.0])
+    def test_matches_scalar(self, factor):
+        """Test batch results equal per-color adjust_saturation."""
+        expected = [c.adjust_saturation(factor) for c in self.COLORS]
+        assert Color.adjust_saturation_many(self.COLORS, factor) == expected
+
+    def test_empty(self):
+        """Test empty input."""
+        assert Color.adjust_saturation_many([], 1.5) == []
+
+
 class TestColorScheme:
     """Tests for ColorScheme type."""
 
@@ -160,6 +190,14 @@ class TestGeneratorConfig:
         assert config.formats is not None
         assert isinstance(config.backend_options, dict)
 
+    def test_from_settings_formats_not_shared(self, app_config):
+        """Test cached format conversion yields an independent list per config."""
+        first = GeneratorConfig.from_settings(app_config)
+        second = GeneratorConfig.from_settings(app_config)
+
+        assert first.formats == [ColorFormat(f) for f in app_config.output.formats]
+        assert first.formats is not second.formats
+
     def test_from_settings_with_overrides(self, app_config):
         """Test creating config with overrides."""
         config = GeneratorConfig.from_settings(
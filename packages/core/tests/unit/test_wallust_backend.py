@@ -13,6 +13,8 @@ from color_scheme.core.exceptions import (
 )
 from color_scheme.core.types import GeneratorConfig
 
+WALLUST_CACHE_DIR = "color_scheme.backends.wallust._WALLUST_CACHE_DIR"
+
 
 class TestWallustGenerator:
     """Tests for WallustGenerator."""
@@ -97,8 +99,8 @@ class TestWallustGenerator:
         # Mock subprocess to succeed
         mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-        # Mock Path.home() to return tmp_path
-        with patch("pathlib.Path.home", return_value=tmp_path):
+        # Point the wallust cache at tmp_path
+        with patch(WALLUST_CACHE_DIR, tmp_path / ".cache" / "wallust"):
             scheme = generator.generate(test_image, config)
 
         assert scheme.backend == "wallust"
@@ -175,7 +177,7 @@ class TestWallustGenerator:
 
         mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
+        with patch(WALLUST_CACHE_DIR, tmp_path / ".cache" / "wallust"):
             with pytest.raises(ColorExtractionError) as exc_info:
                 generator.generate(test_image, config)
 
@@ -219,7 +221,7 @@ class TestWallustGenerator:
 
         config = GeneratorConfig(saturation_adjustment=1.5)
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
+        with patch(WALLUST_CACHE_DIR, tmp_path / ".cache" / "wallust"):
             scheme = generator.generate(test_image, config)
 
         assert scheme.backend == "wallust"
@@ -233,7 +235,7 @@ class TestWallustGenerator:
         """Test error when cache directory doesn't exist."""
         mock_which.return_value = "/usr/bin/wallust"
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
+        with patch(WALLUST_CACHE_DIR, tmp_path / ".cache" / "wallust"):
             with pytest.raises(ColorExtractionError) as exc_info:
                 generator.generate(test_image, config)
 
@@ -250,7 +252,7 @@ class TestWallustGenerator:
         cache_dir = tmp_path / ".cache" / "wallust"
         cache_dir.mkdir(parents=True)
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
+        with patch(WALLUST_CACHE_DIR, tmp_path / ".cache" / "wallust"):
             with pytest.raises(ColorExtractionError) as exc_info:
                 generator.generate(test_image, config)
 
@@ -268,8 +270,49 @@ class TestWallustGenerator:
         subdir.mkdir(parents=True)
         (subdir / "large.bin").write_bytes(b"x" * 15000)
 
-        with patch("pathlib.Path.home", return_value=tmp_path):
+        with patch(WALLUST_CACHE_DIR, tmp_path / ".cache" / "wallust"):
             with pytest.raises(ColorExtractionError) as exc_info:
                 generator.generate(test_image, config)
 
             assert "palette file" in str(exc_info.value.reason).lower()
+
+    def test_latest_subdir_picks_newest(self, generator, tmp_path):
+        """Test the most recently modified cache subdirectory is chosen."""
+        import os
+
+        old = tmp_path / "old"
+        new = tmp_path / "new"
+        old.mkdir()
+        new.mkdir()
+        (tmp_path / "stray-file").write_text("")
+        os.utime(old, (1_000, 1_000))
+        os.utime(new, (2_000, 2_000))
+
+        assert generator._latest_subdir(tmp_path) == new
+
+    def test_latest_subdir_empty(self, generator, tmp_path):
+        """Test None is returned when there are no subdirectories."""
+        (tmp_path / "stray-file").write_text("")
+
+        assert generator._latest_subdir(tmp_path) is None
+
+    def test_find_palette_file_prefers_longest_small_file(self, generator, tmp_path):
+        """Test the small file with the longest name is the palette."""
+        (tmp_path / "short").write_text("{}")
+        (tmp_path / "much_longer_palette_name").write_text("{}")
+        (tmp_path / "an_even_longer_but_large_blob").write_bytes(b"x" * 15000)
+        (tmp_path / "a_directory_with_the_longest_name").mkdir()
+
+        palette = generator._find_palette_file(tmp_path)
+
+        assert palette == tmp_path / "much_longer_palette_name"
+
+    @patch("shutil.which")
+    def test_is_available_looks_up_path_once(self, mock_which, generator):
+        """Test repeated availability checks reuse the first lookup."""
+        mock_which.return_value = "/usr/bin/wallust"
+
+        assert generator.is_available() is True
+        assert generator.is_available() is True
+
+        mock_which.assert_called_once_with("wallust")
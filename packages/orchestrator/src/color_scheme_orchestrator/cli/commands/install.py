@@ -8,6 +8,8 @@ from color_scheme.config.enums import Backend
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from color_scheme_orchestrator.config.settings import VALID_ENGINES
+
 console = Console()
 
 # Map backends to their Dockerfile names
@@ -93,7 +95,7 @@ def install(
             container_engine = "docker"
         else:
             container_engine = engine.lower()
-            if container_engine not in ["docker", "podman"]:
+            if container_engine not in VALID_ENGINES:
                 console.print(
                     f"[red]Error:[/red] Invalid engine '{container_engine}'. "
                     "Must be 'docker' or 'podman'."
@@ -6,6 +6,8 @@ import typer
 from color_scheme.config.enums import Backend
 from rich.console import Console
 
+from color_scheme_orchestrator.config.settings import VALID_ENGINES
+
 console = Console()
 
 
@@ -89,7 +91,7 @@ def uninstall(
             container_engine = "docker"
         else:
             container_engine = engine.lower()
-            if container_engine not in ["docker", "podman"]:
+            if container_engine not in VALID_ENGINES:
                 console.print(
                     f"[red]Error:[/red] Invalid engine '{container_engine}'. "
                     "Must be 'docker' or 'podman'."
@@ -29,6 +29,26 @@ app.command()(uninstall)
 
 console = Console()
 
+# Parameters shared by the generate and show commands
+_IMAGE_PATH_ARGUMENT = typer.Argument(
+    ...,
+    help="Path to source image",
+)
+_SATURATION_OPTION = typer.Option(
+    None,
+    "--saturation",
+    "-s",
+    min=0.0,
+    max=2.0,
+    help="Saturation adjustment factor (0.0-2.0)",
+)
+_DRY_RUN_OPTION = typer.Option(
+    False,
+    "--dry-run",
+    "-n",
+    help="Show what would be done without executing",
+)
+
 
 @app.command()
 def version():
@@ -40,10 +60,7 @@ def version():
 
 @app.command()
 def generate(
-    image_path: Path = typer.Argument(
-        ...,
-        help="Path to source image",
-    ),
+    image_path: Path = _IMAGE_PATH_ARGUMENT,
     output_dir: Path | None = typer.Option(
         None,
         "--output-dir",
@@ -62,20 +79,8 @@ def generate(
         "-f",
         help="Output format(s) to generate (can be specified multiple times)",
     ),
-    saturation: float | None = typer.Option(
-        None,
-        "--saturation",
-        "-s",
-        min=0.0,
-        max=2.0,
-        help="Saturation adjustment factor (0.0-2.0)",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be done without executing",
-    ),
+    saturation: float | None = _SATURATION_OPTION,
+    dry_run: bool = _DRY_RUN_OPTION,
 ) -> None:
     """Generate color scheme using containerized backend.
 
@@ -217,30 +222,15 @@ def generate(
 
 @app.command()
 def show(
-    image_path: Path = typer.Argument(
-        ...,
-        help="Path to source image",
-    ),
+    image_path: Path = _IMAGE_PATH_ARGUMENT,
     backend: Backend | None = typer.Option(
         None,
         "--backend",
         "-b",
         help="Backend to use for color extraction (auto-detects if not specified)",
     ),
-    saturation: float | None = typer.Option(
-        None,
-        "--saturation",
-        "-s",
-        min=0.0,
-        max=2.0,
-        help="Saturation adjustment factor (0.0-2.0)",
-    ),
-    dry_run: bool = typer.Option(
-        False,
-        "--dry-run",
-        "-n",
-        help="Show what would be done without executing",
-    ),
+    saturation: float | None = _SATURATION_OPTION,
+    dry_run: bool = _DRY_RUN_OPTION,
 ) -> None:
     """Display color scheme in terminal (delegates to core).
 
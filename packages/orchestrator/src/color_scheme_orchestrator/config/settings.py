@@ -2,6 +2,9 @@
 
 from pydantic import BaseModel, Field, field_validator
 
+# Supported container engines
+VALID_ENGINES = frozenset({"docker", "podman"})
+
 
 class ContainerSettings(BaseModel):
     """Container engine configuration.
@@ -23,12 +26,11 @@ class ContainerSettings(BaseModel):
     @classmethod
     def validate_engine(cls, v: str) -> str:
         """Validate container engine is valid."""
-        valid_engines = {"docker", "podman"}
         v_lower = v.lower()
-        if v_lower not in valid_engines:
+        if v_lower not in VALID_ENGINES:
             raise ValueError(
                 f"Invalid container engine: {v}. "
-                f"Must be one of: {', '.join(sorted(valid_engines))}"
+                f"Must be one of: {', '.join(sorted(VALID_ENGINES))}"
             )
         return v_lower
 
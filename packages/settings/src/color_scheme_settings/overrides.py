@@ -31,23 +31,46 @@ def apply_overrides(
     if not overrides:
         return config
 
-    config_dict = config.model_dump(mode="python")
-
     for dotted_key, value in overrides.items():
-        parts = dotted_key.split(".")
-        target = config_dict
-
-        # Walk to the parent of the leaf key
-        for segment in parts[:-1]:
-            if not isinstance(target, dict) or segment not in target:
-                raise SettingsOverrideError(key=dotted_key)
-            target = target[segment]
-
-        # Set the leaf value
-        leaf = parts[-1]
-        if not isinstance(target, dict) or leaf not in target:
+        config = _replace(config, dotted_key.split("."), value, dotted_key)
+    return config
+
+
+def _replace(node: Any, parts: list[str], value: Any, dotted_key: str) -> Any:
+    """Return a copy of node with the value at a key path replaced.
+
+    Only the model that owns the changed field is re-validated; untouched
+    sections are shared with the original config.
+
+    Args:
+        node: Model or dict to descend into
+        parts: Remaining key path segments
+        value: Value to set at the end of the path
+        dotted_key: Full key path, for error reporting
+
+    Returns:
+        Updated copy of node.
+
+    Raises:
+        SettingsOverrideError: If a key path doesn't exist in the config.
+    """
+    head, rest = parts[0], parts[1:]
+
+    if isinstance(node, BaseModel):
+        if head not in type(node).model_fields:
             raise SettingsOverrideError(key=dotted_key)
-        target[leaf] = value
+        child = getattr(node, head)
+        if rest and isinstance(child, BaseModel):
+            return node.model_copy(
+                update={head: _replace(child, rest, value, dotted_key)}
+            )
+        data = dict(node)
+        data[head] = _replace(child, rest, value, dotted_key) if rest else value
+        return node.__class__.model_validate(data)
+
+    if isinstance(node, dict) and head in node:
+        updated = dict(node)
+        updated[head] = _replace(node[head], rest, value, dotted_key) if rest else value
+        return updated
 
-    # Re-validate through Pydantic
-    return config.__class__.model_validate(config_dict)
+    raise SettingsOverrideError(key=dotted_key)
@@ -61,7 +61,11 @@ def is_container_environment() -> bool:
 
 def get_xdg_config_home() -> Path:
     """Return XDG_CONFIG_HOME, reading the environment at call time."""
-    return Path(os.getenv("XDG_CONFIG_HOME", str(Path.home() / ".config")))
+    config_home = os.getenv("XDG_CONFIG_HOME")
+    if config_home is not None:
+        return Path(config_home)
+    # Only look up the home directory when it is actually needed
+    return Path.home() / ".config"
 
 
 def get_user_settings_file() -> Path:
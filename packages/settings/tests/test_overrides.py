@@ -3,7 +3,7 @@
 from pathlib import Path
 
 import pytest
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from color_scheme_settings.errors import SettingsOverrideError
 from color_scheme_settings.overrides import apply_overrides
@@ -113,3 +113,20 @@ class TestApplyOverrides:
             result.core.generation.saturation_adjustment
             == base_config.core.generation.saturation_adjustment
         )
+
+    def test_invalid_value_raises_validation_error(
+        self, base_config: MockUnifiedConfig
+    ):
+        with pytest.raises(ValidationError):
+            apply_overrides(base_config, {"core.generation.saturation_adjustment": 5.0})
+
+    def test_value_is_coerced(self, base_config: MockUnifiedConfig):
+        result = apply_overrides(base_config, {"core.output.directory": "/tmp/out"})
+        assert result.core.output.directory == Path("/tmp/out")
+
+    def test_untouched_sections_are_shared(self, base_config: MockUnifiedConfig):
+        result = apply_overrides(
+            base_config, {"core.generation.saturation_adjustment": 1.5}
+        )
+        assert result.core.output is base_config.core.output
+        assert result.orchestrator is base_config.orchestrator
@@ -219,3 +219,22 @@ class TestXdgConfigHomeFunctions:
         monkeypatch.setenv("XDG_CONFIG_HOME", "/tmp/test-xdg")
         result = paths.get_user_settings_file()
         assert str(result) == "/tmp/test-xdg/color-scheme/settings.toml"
+
+    def test_xdg_config_home_falls_back_to_home(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        from color_scheme_settings import paths
+
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert paths.get_xdg_config_home() == tmp_path / ".config"
+
+    def test_xdg_config_home_set_skips_home_lookup(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        from color_scheme_settings import paths
+
+        monkeypatch.setenv("XDG_CONFIG_HOME", "/tmp/test-xdg")
+        with patch("pathlib.Path.home") as mock_home:
+            paths.get_xdg_config_home()
+        mock_home.assert_not_called()